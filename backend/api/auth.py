@@ -45,6 +45,7 @@ async def register(user_data: UserCreate):
         )
 
     hashed_password = get_password_hash(user_data.password)
+    now = datetime.utcnow().isoformat()
 
     user_doc = {
         "email": user_data.email,
@@ -53,8 +54,8 @@ async def register(user_data: UserCreate):
         "hashed_password": hashed_password,
         "role": "analyst",
         "is_active": True,
-        "created_at": datetime.utcnow().isoformat(),
-        "updated_at": datetime.utcnow().isoformat(),
+        "created_at": now,
+        "updated_at": now,
     }
 
     result = await MongoDB.db.users.insert_one(user_doc)
@@ -14,7 +14,6 @@ from bson import ObjectId
 import logging
 import traceback
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
@@ -28,6 +28,8 @@ class Settings(BaseSettings):
 
     POPPLER_PATH: str = os.getenv("POPPLER_PATH", "")
     TESSERACT_PATH: str = os.getenv("TESSERACT_PATH", "")
+    OCR_DPI: int = int(os.getenv("OCR_DPI", "150"))
+    OCR_RETRY_DPI: int = int(os.getenv("OCR_RETRY_DPI", "300"))
 
     AZURE_OPENAI_ENDPOINT: str = os.getenv("AZURE_OPENAI_ENDPOINT", "")
     AZURE_OPENAI_API_KEY: str = os.getenv("AZURE_OPENAI_API_KEY", "")
@@ -304,5 +304,5 @@ async def get_document_analysis(document_id: str):
     tags=["Health"],
     summary="Health check endpoint",
 )
-async def health_check():
+async def health_check() -> Dict[str, str]:
     return {"status": "healthy", "service": "ai-underwriting"}
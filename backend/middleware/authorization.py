@@ -1,3 +1,4 @@
+import logging
 from functools import wraps
 from typing import Callable, List, Optional
 from fastapi import Depends, HTTPException, status
@@ -5,6 +6,8 @@ from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from models.auth import UserRole, TokenData
 from .auth import get_current_user
 
+logger = logging.getLogger(__name__)
+
 security = HTTPBearer()
 
 
@@ -27,7 +30,6 @@ def require_roles(*roles: UserRole):
             )
 
         if current_user.role not in roles:
-            logger = __import__("logging").getLogger(__name__)
             logger.warning(
                 f"Access denied: user {current_user.user_id} with role "
                 f"{current_user.role} attempted to access resource requiring {roles}"
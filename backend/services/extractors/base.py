@@ -3,13 +3,29 @@ Base extractor class that defines the interface for all document extractors.
 Includes market data integration and enhanced validation capabilities.
 """
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, List, Mapping, Optional, Sequence, Tuple
 import logging
+import re
 from datetime import datetime
 from enum import Enum
 
 logger = logging.getLogger(__name__)
 
+# Characters stripped from numeric cells (currency symbols, commas, whitespace)
+_NON_NUMERIC_RE = re.compile(r'[^\d.-]')
+
+# Number followed by a % symbol
+_PERCENTAGE_RE = re.compile(r'(\d+(?:\.\d+)?)\s*%')
+
+# Common tabular date layouts parsed directly before falling back to dateutil
+_FAST_DATE_FORMATS = ('%Y-%m-%d', '%m/%d/%Y')
+
+# Weights of the base, format, range and market components of field confidence
+_BASE_WEIGHT = 0.3
+_FORMAT_WEIGHT = 0.2
+_RANGE_WEIGHT = 0.2
+_MARKET_WEIGHT = 0.3
+
 class RiskProfile(Enum):
     """Risk profile classification."""
     CORE = "core"
@@ -33,13 +49,24 @@ class BaseExtractor(ABC):
         }
         
     @abstractmethod
-    def can_handle(self, content: str, filename: str) -> Tuple[bool, float]:
+    def can_handle(
+        self,
+        content: str,
+        filename: str,
+        content_lower: Optional[str] = None,
+        need_full_score: bool = True
+    ) -> Tuple[bool, float]:
         """
         Determine if this extractor can handle the given document with confidence score.
         
         Args:
             content: The text content of the document
             filename: The name of the file
+            content_lower: content.lower(), when the caller has already computed
+                it so several extractors can share one lowercasing pass
+            need_full_score: False when the caller only uses the bool; scoring
+                may then stop once the document qualifies, and the confidence
+                is only a lower bound
             
         Returns:
             Tuple[bool, float]: (Can handle, confidence score)
@@ -187,18 +214,11 @@ class BaseExtractor(ABC):
             market_score = self._calculate_market_alignment(field, value)
             
             # Weighted average of scores
-            weights = {
-                "base": 0.3,
-                "format": 0.2,
-                "range": 0.2,
-                "market": 0.3
-            }
-            
             final_score = (
-                base_score * weights["base"] +
-                format_score * weights["format"] +
-                range_score * weights["range"] +
-                market_score * weights["market"]
+                base_score * _BASE_WEIGHT +
+                format_score * _FORMAT_WEIGHT +
+                range_score * _RANGE_WEIGHT +
+                market_score * _MARKET_WEIGHT
             )
             
             return round(final_score, 3)
@@ -246,10 +266,9 @@ class BaseExtractor(ABC):
         Returns:
             Optional[float]: Extracted number or default
         """
-        import re
         try:
             # Remove currency symbols and commas
-            cleaned = re.sub(r'[^\d.-]', '', text)
+            cleaned = _NON_NUMERIC_RE.sub('', text)
             return float(cleaned)
         except (ValueError, TypeError):
             return default
@@ -265,10 +284,9 @@ class BaseExtractor(ABC):
         Returns:
             Optional[float]: Extracted percentage or default
         """
-        import re
         try:
             # Find number followed by % symbol
-            match = re.search(r'(\d+(?:\.\d+)?)\s*%', text)
+            match = _PERCENTAGE_RE.search(text)
             if match:
                 return float(match.group(1))
             return default
@@ -286,6 +304,17 @@ class BaseExtractor(ABC):
         Returns:
             Optional[str]: Extracted date in ISO format or default
         """
+        if not isinstance(text, str):
+            return default
+        
+        # Table cells are usually in a fixed layout; strptime is far cheaper than dateutil
+        stripped = text.strip()
+        for date_format in _FAST_DATE_FORMATS:
+            try:
+                return datetime.strptime(stripped, date_format).date().isoformat()
+            except ValueError:
+                pass
+        
         from dateutil.parser import parse
         try:
             date = parse(text)
@@ -502,7 +531,7 @@ class BaseExtractor(ABC):
             return 1.0
 
     @abstractmethod
-    def _get_required_fields(self) -> List[str]:
+    def _get_required_fields(self) -> Sequence[str]:
         """Get list of required fields for this extractor."""
         pass
 
@@ -512,6 +541,6 @@ class BaseExtractor(ABC):
         pass
 
     @abstractmethod
-    def _get_range_rules(self) -> Dict[str, Tuple[float, float]]:
+    def _get_range_rules(self) -> Mapping[str, Tuple[float, float]]:
         """Get numerical range rules for this extractor."""
         pass
@@ -9,6 +9,16 @@ from .base import BaseExtractor
 
 logger = logging.getLogger(__name__)
 
+# Content indicators for can_handle, matched against lowercased content
+_INDICATOR_RE = re.compile(
+    r'lease\s*agreement'
+    r'|tenant\s*lease'
+    r'|rental\s*agreement'
+    r'|landlord\s*and\s*tenant'
+    r'|premises\s*lease'
+    r'|term\s*of\s*lease'
+)
+
 class LeaseExtractor(BaseExtractor):
     """Extracts detailed information from lease documents."""
     
@@ -16,13 +26,21 @@ class LeaseExtractor(BaseExtractor):
         """Initialize the lease extractor."""
         super().__init__()
         
-    def can_handle(self, content: str, filename: str) -> bool:
+    def can_handle(
+        self,
+        content: str,
+        filename: str,
+        content_lower: Optional[str] = None,
+        need_full_score: bool = True
+    ) -> bool:
         """
         Determine if this is a lease document.
         
         Args:
             content: Document content
             filename: Name of the file
+            content_lower: Precomputed content.lower(), if available
+            need_full_score: Unused; the answer is already a plain bool
             
         Returns:
             bool: True if this is a lease document
@@ -35,17 +53,9 @@ class LeaseExtractor(BaseExtractor):
             return True
             
         # Check content for lease indicators
-        indicators = [
-            r'lease\s*agreement',
-            r'tenant\s*lease',
-            r'rental\s*agreement',
-            r'landlord\s*and\s*tenant',
-            r'premises\s*lease',
-            r'term\s*of\s*lease'
-        ]
-        
-        content_lower = content.lower()
-        return any(re.search(pattern, content_lower) for pattern in indicators)
+        if content_lower is None:
+            content_lower = content.lower()
+        return _INDICATOR_RE.search(content_lower) is not None
     
     def extract(self, content: str) -> Dict[str, Any]:
         """
@@ -11,6 +11,15 @@ from .pl_statement import PLStatementExtractor
 
 logger = logging.getLogger(__name__)
 
+# Content indicators for can_handle, matched against lowercased content
+_INDICATOR_RE = re.compile(
+    r'operating\s*statement'
+    r'|property\s*performance'
+    r'|actual\s*vs\s*budget'
+    r'|variance\s*report'
+    r'|year\s*to\s*date'
+)
+
 class OperatingStatementExtractor(BaseExtractor):
     """
     Extracts data from operating statements, which often combine
@@ -23,13 +32,21 @@ class OperatingStatementExtractor(BaseExtractor):
         self.rent_roll_extractor = RentRollExtractor()
         self.pl_extractor = PLStatementExtractor()
         
-    def can_handle(self, content: str, filename: str) -> bool:
+    def can_handle(
+        self,
+        content: str,
+        filename: str,
+        content_lower: Optional[str] = None,
+        need_full_score: bool = True
+    ) -> bool:
         """
         Determine if this is an operating statement.
         
         Args:
             content: Document content
             filename: Name of the file
+            content_lower: Precomputed content.lower(), if available
+            need_full_score: Unused; the answer is already a plain bool
             
         Returns:
             bool: True if this is an operating statement
@@ -42,16 +59,9 @@ class OperatingStatementExtractor(BaseExtractor):
             return True
             
         # Check content for operating statement indicators
-        indicators = [
-            r'operating\s*statement',
-            r'property\s*performance',
-            r'actual\s*vs\s*budget',
-            r'variance\s*report',
-            r'year\s*to\s*date'
-        ]
-        
-        content_lower = content.lower()
-        return any(re.search(pattern, content_lower) for pattern in indicators)
+        if content_lower is None:
+            content_lower = content.lower()
+        return _INDICATOR_RE.search(content_lower) is not None
     
     def extract(self, content: str) -> Dict[str, Any]:
         """
@@ -9,6 +9,18 @@ from .base import BaseExtractor
 
 logger = logging.getLogger(__name__)
 
+# Content indicators for can_handle and their confidence weights, matched
+# against lowercased content
+_INDICATOR_PATTERNS = [
+    (re.compile(r'profit\s*(?:and|&)\s*loss'), 0.2),
+    (re.compile(r'income\s*statement'), 0.15),
+    (re.compile(r'operating\s*statement'), 0.1),
+    (re.compile(r'revenue[s]?'), 0.1),
+    (re.compile(r'expenses?'), 0.05),
+    (re.compile(r'net\s*operating\s*income'), 0.05),
+    (re.compile(r'gross\s*income'), 0.05)
+]
+
 class PLStatementExtractor(BaseExtractor):
     """Extracts financial data from profit and loss statements."""
     
@@ -18,13 +30,23 @@ class PLStatementExtractor(BaseExtractor):
         self.revenue_items: List[Dict[str, Any]] = []
         self.expense_items: List[Dict[str, Any]] = []
         
-    def can_handle(self, content: str, filename: str) -> Tuple[bool, float]:
+    def can_handle(
+        self,
+        content: str,
+        filename: str,
+        content_lower: Optional[str] = None,
+        need_full_score: bool = True
+    ) -> Tuple[bool, float]:
         """
         Determine if this is a P&L statement with confidence score.
         
         Args:
             content: Document content
             filename: Name of the file
+            content_lower: Precomputed content.lower(), if available
+            need_full_score: When False, stop scanning as soon as the
+                minimum confidence is reached; the returned score is then
+                a lower bound
             
         Returns:
             Tuple[bool, float]: (Can handle, confidence score)
@@ -45,22 +67,18 @@ class PLStatementExtractor(BaseExtractor):
             if term in filename_lower
         )
         
-        # Check content for P&L indicators (70% of confidence)
-        content_indicators = [
-            (r'profit\s*(?:and|&)\s*loss', 0.2),
-            (r'income\s*statement', 0.15),
-            (r'operating\s*statement', 0.1),
-            (r'revenue[s]?', 0.1),
-            (r'expenses?', 0.05),
-            (r'net\s*operating\s*income', 0.05),
-            (r'gross\s*income', 0.05)
-        ]
-        
-        content_lower = content.lower()
-        content_confidence = sum(
-            weight for pattern, weight in content_indicators 
-            if re.search(pattern, content_lower)
-        )
+        if not need_full_score and filename_confidence >= 0.3:
+            return True, round(filename_confidence, 3)
+        
+        # Check content for P&L indicators (70% of confidence), heaviest first
+        if content_lower is None:
+            content_lower = content.lower()
+        content_confidence = 0.0
+        for pattern, weight in _INDICATOR_PATTERNS:
+            if pattern.search(content_lower):
+                content_confidence += weight
+                if not need_full_score and filename_confidence + content_confidence >= 0.3:
+                    break
         
         # Calculate total confidence
         confidence = filename_confidence + content_confidence
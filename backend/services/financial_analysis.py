@@ -1,181 +1,274 @@
 import re
+import hashlib
 import logging
-from typing import Dict, List, Optional, Tuple
-from datetime import datetime
-from config.settings import settings
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Pattern, Tuple
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Value patterns for labeled fields. Digit groups are separated by a literal
+# comma or period, so a digit run can only be split one way and a failed match
+# backtracks at most once over the run: matching stays linear in the text length.
+_AMOUNT = r"\$?(?P<{}>\d+(?:,\d{{3}})*(?:\.\d{{2}})?)"
+_PERCENT = r"(?P<{}>\d+(?:\.\d{{1,2}})?)\s*%"
+
+_NUMBER_RE = re.compile(r"\$?(\d+(?:,\d{3})*(?:\.\d{2})?)")
+_DIGIT_RE = re.compile(r"\d")
+
+# Field name, lowercase alternative labels and value pattern for every labeled
+# metric. Patterns run against lowercased text, so no IGNORECASE is needed.
+_FIELD_SPECS = (
+    ("noi", (r"noi", r"net operating income", r"operating\s*income"), _AMOUNT),
+    ("occupancy", (r"occupancy", r"occupied", r"leased"), _PERCENT),
+    (
+        "property_value",
+        (
+            r"property\s*value",
+            r"appraised\s*value",
+            r"market\s*value",
+            r"purchase\s*price",
+        ),
+        _AMOUNT,
+    ),
+    (
+        "loan_amount",
+        (r"loan\s*amount", r"mortgage\s*amount", r"loan\s*balance"),
+        _AMOUNT,
+    ),
+    (
+        "debt_service",
+        (r"debt\s*service", r"annual\s*debt\s*service", r"annual\s*debt\s*payment"),
+        _AMOUNT,
+    ),
+    (
+        "gross_income",
+        (
+            r"gross\s*income",
+            r"gross\s*potential\s*income",
+            r"effective\s*gross\s*income",
+        ),
+        _AMOUNT,
+    ),
+    (
+        "total_expenses",
+        (r"total\s*expenses", r"operating\s*expenses", r"operating\s*costs"),
+        _AMOUNT,
+    ),
+)
+
+# Lowercase substrings at least one of which must appear for a field to match.
+_FIELD_LITERALS = {
+    "noi": ("noi", "operating"),
+    "occupancy": ("occupancy", "occupied", "leased"),
+    "property_value": ("value", "purchase"),
+    "loan_amount": ("loan", "mortgage"),
+    "debt_service": ("debt",),
+    "gross_income": ("gross",),
+    "total_expenses": ("expenses", "operating"),
+}
+_ALL_LITERALS = tuple(
+    sorted({literal for literals in _FIELD_LITERALS.values() for literal in literals})
+)
+
+
+def _field_pattern(field: str, labels: Tuple[str, ...], value: str) -> str:
+    """Fuse alternative field labels into one pattern sharing a value capture."""
+    return "(?:" + "|".join(labels) + r")[:|\s]+" + value.format(field)
+
+
+def _parse_amount(value: str) -> float:
+    """Convert a captured amount such as ``1,234.56`` to a float."""
+    if "," in value:
+        value = value.replace(",", "")
+    return float(value)
+
+
+_FIELD_RES = {
+    spec[0]: re.compile(_field_pattern(*spec)) for spec in _FIELD_SPECS
+}
+_FIELDS_RE = re.compile("|".join(_field_pattern(*spec) for spec in _FIELD_SPECS))
+
+# Keys of an analysis result, in the order of the rows built by _result_row.
+_RESULT_KEYS = (
+    "noi",
+    "capRate",
+    "dscr",
+    "ltv",
+    "occupancyRate",
+    "grossIncome",
+    "totalExpenses",
+    "expenseRatio",
+    "debtYield",
+    "loanAmount",
+    "propertyValue",
+    "debtService",
+)
+
+# Recent analyze_document result rows keyed by a digest of the OCR text and
+# the estimation defaults they were computed with.
+_ANALYSIS_CACHE: "OrderedDict[Tuple[bytes, Tuple], Tuple[float, ...]]" = OrderedDict()
+_ANALYSIS_CACHE_SIZE = 512
+
+
+def _safe_divide(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """Element-wise division that yields 0 wherever the denominator is 0."""
+    out = np.zeros_like(numerator)
+    np.divide(numerator, denominator, out=out, where=denominator != 0)
+    return out
+
 
 class FinancialAnalysis:
     """Comprehensive financial analysis for commercial real estate underwriting."""
 
-    DEFAULTS = {
+    # Read-only so the defaults only change by rebinding DEFAULTS, e.g. in a
+    # subclass, which _defaults_key detects by identity.
+    DEFAULTS = MappingProxyType({
         "property_value_multiplier": 2.0,
         "loan_to_value_ratio": 0.7,
         "debt_service_rate": 0.08,
         "min_noi_threshold": 100000,
         "min_value_threshold": 100000,
-    }
+    })
+
+    # (DEFAULTS mapping, its cache-key tuple) from the last _defaults_key call
+    _defaults_key_cache: Tuple[Optional[Mapping], Tuple] = (None, ())
 
     @staticmethod
     def extract_numbers(text: str) -> List[float]:
         """Extract all numbers from text."""
-        return [float(x) for x in re.findall(r"\$?(\d+(?:,\d{3})*(?:\.\d{2})?)", text)]
+        return [float(x.replace(",", "")) for x in _NUMBER_RE.findall(text)]
 
     @staticmethod
-    def extract_currency_amount(text: str, pattern: str) -> Optional[float]:
-        """Extract currency amount using regex pattern."""
-        match = re.search(pattern, text, re.IGNORECASE)
+    def _max_extracted_number(text: str) -> Optional[float]:
+        """Return the largest number in text without materialising the full list."""
+        best = None
+        for match in _NUMBER_RE.finditer(text):
+            value = _parse_amount(match.group(1))
+            if best is None or value > best:
+                best = value
+        return best
+
+    @staticmethod
+    def extract_currency_amount(text: str, pattern: Pattern) -> Optional[float]:
+        """Extract currency amount using a compiled regex pattern."""
+        match = pattern.search(text)
         if match:
-            return float(match.group(1).replace(",", ""))
+            return _parse_amount(match.group(1))
         return None
 
+    @staticmethod
+    def scan_fields(text: str) -> Dict[str, float]:
+        """Extract every labeled field in a single pass, keeping first occurrences."""
+        fields: Dict[str, float] = {}
+        text_lower = text.lower()
+        if not any(literal in text_lower for literal in _ALL_LITERALS):
+            return fields
+        for match in _FIELDS_RE.finditer(text_lower):
+            field = match.lastgroup
+            if field not in fields:
+                fields[field] = _parse_amount(match.group(field))
+                if len(fields) == len(_FIELD_SPECS):
+                    break
+        return fields
+
+    @staticmethod
+    def _find_field(field: str, text: str) -> Optional[float]:
+        """Search for one field, skipping the regex when none of its labels occur."""
+        text_lower = text.lower()
+        if not any(literal in text_lower for literal in _FIELD_LITERALS[field]):
+            return None
+        return FinancialAnalysis.extract_currency_amount(text_lower, _FIELD_RES[field])
+
     @staticmethod
     def find_noi(text: str) -> Optional[float]:
         """Extract NOI from document text."""
-        noi_patterns = [
-            r"NOI[:|\s]+\$?(\d+(?:,\d{3})*(?:\.\d{2})?)",
-            r"Net Operating Income[:|\s]+\$?(\d+(?:,\d{3})*(?:\.\d{2})?)",
-            r"Operating\s*Income[:|\s]+\$?(\d+(?:,\d{3})*(?:\.\d{2})?)",
-        ]
-        for pattern in noi_patterns:
-            result = FinancialAnalysis.extract_currency_amount(text, pattern)
-            if result is not None:
-                return result
-        return None
+        return FinancialAnalysis._find_field("noi", text)
 
     @staticmethod
     def find_occupancy(text: str) -> Optional[float]:
         """Extract occupancy rate from document text."""
-        occupancy_patterns = [
-            r"Occupancy[:|\s]+(\d+(?:\.\d{1,2})?)\s*%",
-            r"Occupied[:|\s]+(\d+(?:\.\d{1,2})?)\s*%",
-            r"Leased[:|\s]+(\d+(?:\.\d{1,2})?)\s*%",
-        ]
-        for pattern in occupancy_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return float(match.group(1))
-        return None
+        if "%" not in text:
+            return None
+        return FinancialAnalysis._find_field("occupancy", text)
 
     @staticmethod
     def find_property_value(text: str) -> Optional[float]:
         """Extract property value from document text."""
-        value_patterns = [
-            r"Property\s*Value[:|\s]+\$?(\d+(?:,\d{3})*(?:\.\d{2})?)",
-            r"Appraised\s*Value[:|\s]+\$?(\d+(?:,\d{3})*(?:\.\d{2})?)",
-            r"Market\s*Value[:|\s]+\$?(\d+(?:,\d{3})*(?:\.\d{2})?)",
-            r"Purchase\s*Price[:|\s]+\$?(\d+(?:,\d{3})*(?:\.\d{2})?)",
-        ]
-        for pattern in value_patterns:
-            result = FinancialAnalysis.extract_currency_amount(text, pattern)
-            if result is not None:
-                return result
-        return None
+        return FinancialAnalysis._find_field("property_value", text)
 
     @staticmethod
     def find_loan_amount(text: str) -> Optional[float]:
         """Extract loan amount from document text."""
-        loan_patterns = [
-            r"Loan\s*Amount[:|\s]+\$?(\d+(?:,\d{3})*(?:\.\d{2})?)",
-            r"Mortgage\s*Amount[:|\s]+\$?(\d+(?:,\d{3})*(?:\.\d{2})?)",
-            r"Loan\s*Balance[:|\s]+\$?(\d+(?:,\d{3})*(?:\.\d{2})?)",
-        ]
-        for pattern in loan_patterns:
-            result = FinancialAnalysis.extract_currency_amount(text, pattern)
-            if result is not None:
-                return result
-        return None
+        return FinancialAnalysis._find_field("loan_amount", text)
 
     @staticmethod
     def find_debt_service(text: str) -> Optional[float]:
         """Extract annual debt service from document text."""
-        debt_patterns = [
-            r"Debt\s*Service[:|\s]+\$?(\d+(?:,\d{3})*(?:\.\d{2})?)",
-            r"Annual\s*Debt\s*Service[:|\s]+\$?(\d+(?:,\d{3})*(?:\.\d{2})?)",
-            r"Annual\s*Debt\s*Payment[:|\s]+\$?(\d+(?:,\d{3})*(?:\.\d{2})?)",
-        ]
-        for pattern in debt_patterns:
-            result = FinancialAnalysis.extract_currency_amount(text, pattern)
-            if result is not None:
-                return result
-        return None
+        return FinancialAnalysis._find_field("debt_service", text)
 
     @staticmethod
     def find_gross_income(text: str) -> Optional[float]:
         """Extract gross income from document text."""
-        income_patterns = [
-            r"Gross\s*Income[:|\s]+\$?(\d+(?:,\d{3})*(?:\.\d{2})?)",
-            r"Gross\s*Potential\s*Income[:|\s]+\$?(\d+(?:,\d{3})*(?:\.\d{2})?)",
-            r"Effective\s*Gross\s*Income[:|\s]+\$?(\d+(?:,\d{3})*(?:\.\d{2})?)",
-        ]
-        for pattern in income_patterns:
-            result = FinancialAnalysis.extract_currency_amount(text, pattern)
-            if result is not None:
-                return result
-        return None
+        return FinancialAnalysis._find_field("gross_income", text)
 
     @staticmethod
     def find_total_expenses(text: str) -> Optional[float]:
         """Extract total expenses from document text."""
-        expense_patterns = [
-            r"Total\s*Expenses[:|\s]+\$?(\d+(?:,\d{3})*(?:\.\d{2})?)",
-            r"Operating\s*Expenses[:|\s]+\$?(\d+(?:,\d{3})*(?:\.\d{2})?)",
-            r"Operating\s*Costs[:|\s]+\$?(\d+(?:,\d{3})*(?:\.\d{2})?)",
-        ]
-        for pattern in expense_patterns:
-            result = FinancialAnalysis.extract_currency_amount(text, pattern)
-            if result is not None:
-                return result
-        return None
+        return FinancialAnalysis._find_field("total_expenses", text)
 
     @staticmethod
     def calculate_dscr(noi: float, debt_service: float) -> float:
         """Calculate Debt Service Coverage Ratio."""
-        if not debt_service or debt_service == 0:
+        if not debt_service:
             return 0.0
         return round(noi / debt_service, 2)
 
     @staticmethod
     def calculate_cap_rate(noi: float, property_value: float) -> float:
         """Calculate Capitalization Rate."""
-        if not property_value or property_value == 0:
+        if not property_value:
             return 0.0
         return round((noi / property_value) * 100, 2)
 
+    @staticmethod
+    def _cap_rate_decimal(noi: float, property_value: float) -> float:
+        """Capitalization rate as an unrounded decimal fraction."""
+        return noi / property_value if property_value else 0.0
+
     @staticmethod
     def calculate_ltv(loan_amount: float, property_value: float) -> float:
         """Calculate Loan-to-Value ratio."""
-        if not property_value or property_value == 0:
+        if not property_value:
             return 0.0
         return round((loan_amount / property_value) * 100, 2)
 
     @staticmethod
     def calculate_expense_ratio(total_expenses: float, gross_income: float) -> float:
         """Calculate expense ratio as percentage of gross income."""
-        if not gross_income or gross_income == 0:
+        if not gross_income:
             return 0.0
         return round((total_expenses / gross_income) * 100, 2)
 
     @staticmethod
     def calculate_rent_psf(annual_rent: float, square_footage: float) -> float:
         """Calculate rent per square foot."""
-        if not square_footage or square_footage == 0:
+        if not square_footage:
             return 0.0
         return round(annual_rent / square_footage, 2)
 
     @staticmethod
     def calculate_grm(gross_rent: float, property_value: float) -> float:
         """Calculate Gross Rent Multiplier."""
-        if not gross_rent or gross_rent == 0:
+        if not gross_rent:
             return 0.0
         return round(property_value / gross_rent, 2)
 
     @staticmethod
     def calculate_debt_yield(noi: float, loan_amount: float) -> float:
         """Calculate Debt Yield (NOI / Loan Amount)."""
-        if not loan_amount or loan_amount == 0:
+        if not loan_amount:
             return 0.0
         return round((noi / loan_amount) * 100, 2)
 
@@ -201,24 +294,20 @@ class FinancialAnalysis:
         return "stable"
 
     @classmethod
-    def _estimate_from_numbers(cls, numbers: List[float]) -> Optional[float]:
-        """Estimate NOI from extracted numbers using configurable thresholds."""
-        if not numbers:
+    def _estimate_from_numbers(cls, max_val: Optional[float]) -> Optional[float]:
+        """Estimate NOI from the largest extracted number."""
+        if max_val is None:
             return None
-        max_val = max(numbers)
-        threshold = cls.DEFAULTS["min_noi_threshold"]
-        if max_val > threshold:
+        if max_val > cls.DEFAULTS["min_noi_threshold"]:
             return max_val / 12
         return None
 
     @classmethod
-    def _estimate_property_value(cls, numbers: List[float]) -> Optional[float]:
-        """Estimate property value from extracted numbers using configurable multipliers."""
-        if not numbers:
+    def _estimate_property_value(cls, max_val: Optional[float]) -> Optional[float]:
+        """Estimate property value from the largest extracted number."""
+        if max_val is None:
             return None
-        max_val = max(numbers)
-        threshold = cls.DEFAULTS["min_value_threshold"]
-        if max_val > threshold:
+        if max_val > cls.DEFAULTS["min_value_threshold"]:
             return max_val * cls.DEFAULTS["property_value_multiplier"]
         return None
 
@@ -236,27 +325,103 @@ class FinancialAnalysis:
             return None
         return loan_amount * cls.DEFAULTS["debt_service_rate"]
 
+    @classmethod
+    def _defaults_key(cls) -> Tuple:
+        """DEFAULTS as a hashable tuple, rebuilt only when the class's DEFAULTS changes."""
+        defaults = cls.DEFAULTS
+        source, key = cls._defaults_key_cache
+        if source is not defaults:
+            key = tuple(defaults.items())
+            cls._defaults_key_cache = (defaults, key)
+        return key
+
     @classmethod
     async def analyze_document(cls, ocr_result: Dict) -> Dict:
         """Analyze OCR results and extract comprehensive financial metrics."""
         text = ocr_result.get("text", "")
+        key = (hashlib.blake2b(text.encode(), digest_size=16).digest(), cls._defaults_key())
+        row = _ANALYSIS_CACHE.get(key)
+        if row is not None:
+            _ANALYSIS_CACHE.move_to_end(key)
+        else:
+            row = cls._analyze_text(text)
+            _ANALYSIS_CACHE[key] = row
+            if len(_ANALYSIS_CACHE) > _ANALYSIS_CACHE_SIZE:
+                _ANALYSIS_CACHE.popitem(last=False)
+        return dict(zip(_RESULT_KEYS, row))
 
-        noi = cls.find_noi(text)
-        occupancy = cls.find_occupancy(text)
-        property_value = cls.find_property_value(text)
-        loan_amount = cls.find_loan_amount(text)
-        debt_service = cls.find_debt_service(text)
-        gross_income = cls.find_gross_income(text)
-        total_expenses = cls.find_total_expenses(text)
+    @classmethod
+    async def analyze_documents_batch(cls, ocr_results: List[Dict]) -> List[Dict]:
+        """Analyze many OCR results, computing the ratio metrics as array operations."""
+        inputs = [cls._extract_inputs(r.get("text", "")) for r in ocr_results]
+        if not inputs:
+            return []
+
+        noi, _, value, loan, debt, gross, expenses = (
+            np.array(column, dtype=np.float64) for column in zip(*inputs)
+        )
+        dscr = np.round(_safe_divide(noi, debt), 2)
+        cap_rate = _safe_divide(noi, value)
+        ltv = np.round(_safe_divide(loan, value) * 100, 2)
+        expense_ratio = np.round(_safe_divide(expenses, gross) * 100, 2)
+        debt_yield = np.round(_safe_divide(noi, loan) * 100, 2)
+
+        return [
+            dict(zip(_RESULT_KEYS, cls._result_row(values, *metrics)))
+            for values, *metrics in zip(
+                inputs,
+                cap_rate.tolist(),
+                dscr.tolist(),
+                ltv.tolist(),
+                expense_ratio.tolist(),
+                debt_yield.tolist(),
+            )
+        ]
+
+    @classmethod
+    def _analyze_text(cls, text: str) -> Tuple[float, ...]:
+        """Extract financial metrics from OCR text as a result row."""
+        values = cls._extract_inputs(text)
+        noi, _, value, loan, debt, gross, expenses = values
 
-        if noi is None or noi == 0:
-            logger.warning("NOI not found in document, attempting estimation")
-            numbers = cls.extract_numbers(text)
-            noi = cls._estimate_from_numbers(numbers)
+        dscr = cls.calculate_dscr(noi, debt)
+        cap_rate = cls._cap_rate_decimal(noi, value)
+        ltv = cls.calculate_ltv(loan, value)
+        expense_ratio = cls.calculate_expense_ratio(expenses, gross)
+        debt_yield = cls.calculate_debt_yield(noi, loan)
 
-        if property_value is None:
-            numbers = cls.extract_numbers(text)
-            property_value = cls._estimate_property_value(numbers)
+        return cls._result_row(values, cap_rate, dscr, ltv, expense_ratio, debt_yield)
+
+    @classmethod
+    def _extract_inputs(cls, text: str) -> Tuple[float, ...]:
+        """Extract the raw inputs for the metrics, estimating any that are missing.
+
+        Returns (noi, occupancy, property_value, loan_amount, debt_service,
+        gross_income, total_expenses), with missing values coalesced to 0.
+        """
+        if not _DIGIT_RE.search(text):
+            # Every field and the estimation fallback need a number; failed or
+            # empty OCR text has none, so skip the scans entirely.
+            return (0.0,) * 7
+
+        fields = cls.scan_fields(text)
+        noi = fields.get("noi")
+        occupancy = fields.get("occupancy")
+        property_value = fields.get("property_value")
+        loan_amount = fields.get("loan_amount")
+        debt_service = fields.get("debt_service")
+        gross_income = fields.get("gross_income")
+        total_expenses = fields.get("total_expenses")
+
+        estimate_noi = noi is None or noi == 0
+        if estimate_noi or property_value is None:
+            # Both estimators only need the largest number, so scan for it once.
+            max_number = cls._max_extracted_number(text)
+            if estimate_noi:
+                logger.warning("NOI not found in document, attempting estimation")
+                noi = cls._estimate_from_numbers(max_number)
+            if property_value is None:
+                property_value = cls._estimate_property_value(max_number)
 
         if loan_amount is None:
             loan_amount = cls._estimate_loan_amount(property_value)
@@ -264,34 +429,42 @@ class FinancialAnalysis:
         if debt_service is None:
             debt_service = cls._estimate_debt_service(loan_amount)
 
-        noi = noi or 0
-        property_value = property_value or 0
-        loan_amount = loan_amount or 0
-        debt_service = debt_service or 0
-        gross_income = gross_income or noi or 0
-        total_expenses = total_expenses or 0
-        occupancy = occupancy or 0
-
-        dscr = cls.calculate_dscr(noi, debt_service)
-        cap_rate = cls.calculate_cap_rate(noi, property_value)
-        ltv = cls.calculate_ltv(loan_amount, property_value)
-        expense_ratio = cls.calculate_expense_ratio(total_expenses, gross_income)
-        debt_yield = cls.calculate_debt_yield(noi, loan_amount)
-
-        return {
-            "noi": noi,
-            "capRate": cap_rate / 100 if cap_rate else 0,
-            "dscr": dscr,
-            "ltv": ltv,
-            "occupancyRate": occupancy,
-            "grossIncome": gross_income,
-            "totalExpenses": total_expenses,
-            "expenseRatio": expense_ratio,
-            "debtYield": debt_yield,
-            "loanAmount": loan_amount,
-            "propertyValue": property_value,
-            "debtService": debt_service,
-        }
+        noi = noi or 0.0
+        return (
+            noi,
+            occupancy or 0.0,
+            property_value or 0.0,
+            loan_amount or 0.0,
+            debt_service or 0.0,
+            gross_income or noi,
+            total_expenses or 0.0,
+        )
+
+    @staticmethod
+    def _result_row(
+        values: Tuple[float, ...],
+        cap_rate: float,
+        dscr: float,
+        ltv: float,
+        expense_ratio: float,
+        debt_yield: float,
+    ) -> Tuple[float, ...]:
+        """Order extracted inputs and computed ratios to match _RESULT_KEYS."""
+        noi, occupancy, value, loan, debt, gross, expenses = values
+        return (
+            noi,
+            cap_rate,
+            dscr,
+            ltv,
+            occupancy,
+            gross,
+            expenses,
+            expense_ratio,
+            debt_yield,
+            loan,
+            value,
+            debt,
+        )
 
     @classmethod
     def analyze_variance(
@@ -5,13 +5,25 @@ Provides JSON-structured logging for production environments
 and human-readable logs for development.
 """
 
+import atexit
+import copy
 import logging
-import json
+import os
+import queue
 import sys
-from datetime import datetime
-from typing import Any, Dict, Optional
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Dict, Optional, Set
 from pythonjsonlogger import jsonlogger
-from functools import wraps
+from functools import lru_cache, wraps
+from logging.handlers import QueueHandler, QueueListener
+
+from .timestamps import iso_utc
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speed-up
+    orjson = None
 
 
 class CustomJsonFormatter(jsonlogger.JsonFormatter):
@@ -25,25 +37,160 @@ class CustomJsonFormatter(jsonlogger.JsonFormatter):
     ) -> None:
         super().add_fields(log_record, record, message_dict)
 
-        log_record["timestamp"] = datetime.utcnow().isoformat()
+        # format() has already rendered the message, traceback and stack into
+        # record.message and message_dict; reuse them rather than redo the work.
+        log_record["timestamp"] = iso_utc(record.created)
         log_record["level"] = record.levelname
         log_record["logger"] = record.name
-        log_record["message"] = record.getMessage()
+        log_record["message"] = record.message or record.getMessage()
 
         if record.exc_info:
-            log_record["exception"] = self.formatException(record.exc_info)
+            log_record["exception"] = message_dict.get("exc_info") or self.formatException(
+                record.exc_info
+            )
 
         if record.stack_info:
-            log_record["stack"] = self.formatException(record.stack_info)
+            log_record["stack"] = message_dict.get("stack_info") or self.formatStack(
+                record.stack_info
+            )
 
         log_record["module"] = record.module
         log_record["function"] = record.funcName
         log_record["line"] = record.lineno
 
+    def jsonify_log_record(self, log_record: Dict[str, Any]) -> str:
+        """Serialize the record with orjson when available."""
+        if orjson is not None:
+            try:
+                return orjson.dumps(log_record, default=self.json_default).decode()
+            except TypeError:
+                pass
+        return super().jsonify_log_record(log_record)
+
+# Output buffer size for log files, and the longest a buffered record may wait
+# before being written out.
+_BUFFER_SIZE = int(os.getenv("LOG_BUFFER_SIZE", "65536"))
+_FLUSH_INTERVAL = 0.2
+
+
+class _Flusher:
+    """Drains handlers with unflushed output from one long-lived thread.
+
+    The thread is started under the lock by the first schedule call, so
+    concurrent first records still start only one.
+    """
+
+    __slots__ = ("pending", "_lock", "_wakeup", "_thread")
+
+    def __init__(self) -> None:
+        self.pending: Set[logging.StreamHandler] = set()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def schedule(self, handler: logging.StreamHandler) -> None:
+        """Queue a handler for flushing, starting the thread on first use."""
+        with self._lock:
+            self.pending.add(handler)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="log-flusher", daemon=True
+                )
+                self._thread.start()
+        self._wakeup.set()
+
+    def _run(self) -> None:
+        """Flush pending handlers _FLUSH_INTERVAL after the first unflushed record."""
+        while True:
+            self._wakeup.wait()
+            time.sleep(_FLUSH_INTERVAL)
+            self._wakeup.clear()
+            with self._lock:
+                handlers = list(self.pending)
+                self.pending.clear()
+            for handler in handlers:
+                handler.acquire()
+                try:
+                    handler.flush()
+                except (OSError, ValueError):
+                    # The stream was closed after the record was written; keep
+                    # the thread alive for the other handlers.
+                    pass
+                finally:
+                    handler.release()
+
+
+_FLUSHER = _Flusher()
+
+
+if TYPE_CHECKING:
+    _StreamHandlerBase = logging.StreamHandler
+else:
+    _StreamHandlerBase = object
+
+
+class _DeferredFlushMixin(_StreamHandlerBase):
+    """Defer stream flushes so bursts of records are written with few syscalls.
+
+    Records at WARNING and above are flushed immediately; anything else is
+    flushed by the shared flusher thread at most _FLUSH_INTERVAL seconds after
+    it was written.
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.WARNING:
+                self.flush()
+            elif self not in _FLUSHER.pending:
+                _FLUSHER.schedule(self)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class BufferedStreamHandler(_DeferredFlushMixin, logging.StreamHandler):
+    """Stream handler that batches writes instead of flushing every record."""
+
+
+class BufferedFileHandler(_DeferredFlushMixin, logging.FileHandler):
+    """File handler with a large write buffer and deferred flushing."""
+
+    def _open(self):
+        return open(
+            self.baseFilename,
+            self.mode,
+            buffering=_BUFFER_SIZE,
+            encoding=self.encoding,
+            errors=self.errors,
+        )
+
+
+class _StructuredQueueHandler(QueueHandler):
+    """Queue handler that leaves formatting to the listener's handlers.
+
+    The stock prepare() renders the record with a plain formatter and drops
+    exc_info, so the JSON formatter would never see the exception.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+# One background listener per logger name, shared by every StructuredLogger
+# configured for that name so re-initialisation never spawns extra threads.
+_LISTENERS: Dict[str, QueueListener] = {}
+
 
 class StructuredLogger:
     """Structured logger for consistent logging across the application."""
 
+    __slots__ = ("name", "level", "json_format", "logger", "listener")
+
     def __init__(
         self,
         name: str = "ai-underwriting",
@@ -62,7 +209,7 @@ class StructuredLogger:
         self.logger.setLevel(self.level)
         self.logger.handlers = []
 
-        handler = logging.StreamHandler(sys.stdout)
+        handler = BufferedStreamHandler(sys.stdout)
 
         if self.json_format:
             formatter = CustomJsonFormatter(
@@ -74,7 +221,24 @@ class StructuredLogger:
             )
 
         handler.setFormatter(formatter)
-        self.logger.addHandler(handler)
+
+        listener = _LISTENERS.get(self.name)
+        if listener is None:
+            listener = QueueListener(
+                queue.SimpleQueue(), handler, respect_handler_level=True
+            )
+            listener.start()
+            atexit.register(listener.stop)
+            _LISTENERS[self.name] = listener
+        else:
+            listener.handlers = (handler,)
+
+        self.listener = listener
+        self.logger.addHandler(_StructuredQueueHandler(listener.queue))
+
+    def add_handler(self, handler: logging.Handler) -> None:
+        """Attach an output handler that runs on the background listener thread."""
+        self.listener.handlers = self.listener.handlers + (handler,)
 
     def log(
         self,
@@ -129,25 +293,36 @@ class StructuredLogger:
         self.log(logging.CRITICAL, message, extra=extra, exc_info=exc_info)
 
 
+@lru_cache(maxsize=None)
+def _module_logger(module: str) -> StructuredLogger:
+    """Shared StructuredLogger for a module, configured on first use."""
+    return StructuredLogger(module)
+
+
 def log_function_call(logger: Optional[StructuredLogger] = None):
     """Decorator to log function calls with arguments and return values."""
 
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            log = logger or StructuredLogger(func.__module__)
+            log = logger or _module_logger(func.__module__)
+            # str(result) can be huge (e.g. OCR text), so only build the
+            # extras when debug records will actually be emitted.
+            debug_enabled = log.logger.isEnabledFor(logging.DEBUG)
 
-            log.debug(
-                f"Calling {func.__name__}",
-                extra={"args": args, "kwargs": kwargs},
-            )
+            if debug_enabled:
+                log.debug(
+                    f"Calling {func.__name__}",
+                    extra={"args": args, "kwargs": kwargs},
+                )
 
             result = func(*args, **kwargs)
 
-            log.debug(
-                f"{func.__name__} returned",
-                extra={"result": str(result)},
-            )
+            if debug_enabled:
+                log.debug(
+                    f"{func.__name__} returned",
+                    extra={"result": str(result)},
+                )
 
             return result
 
@@ -159,6 +334,8 @@ def log_function_call(logger: Optional[StructuredLogger] = None):
 class RequestLogger:
     """Middleware for logging HTTP requests."""
 
+    __slots__ = ("logger",)
+
     def __init__(self, logger: Optional[StructuredLogger] = None):
         """Initialize request logger."""
         self.logger = logger or StructuredLogger("http")
@@ -174,6 +351,8 @@ class RequestLogger:
     ) -> None:
         """Log an HTTP request."""
         level = logging.INFO if status_code < 400 else logging.WARNING
+        if not self.logger.logger.isEnabledFor(level):
+            return
 
         self.logger.log(
             level,
@@ -213,7 +392,7 @@ def setup_logging(
     )
 
     if log_file:
-        file_handler = logging.FileHandler(log_file)
+        file_handler = BufferedFileHandler(log_file)
         file_handler.setLevel(getattr(logging, level.upper()))
 
         if json_format:
@@ -226,6 +405,6 @@ def setup_logging(
             )
 
         file_handler.setFormatter(file_formatter)
-        logger.logger.addHandler(file_handler)
+        logger.add_handler(file_handler)
 
     return logger
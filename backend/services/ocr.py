@@ -1,15 +1,27 @@
 """
 Enhanced document processing service with OCR and specialized extractors.
 """
+import asyncio
+import hashlib
+import io
 import os
 import logging
+import subprocess
+import tempfile
+import threading
+import xml.etree.ElementTree as ET
+import zipfile
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from functools import partial
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
 import pytesseract
-from pdf2image import convert_from_path
+from pdf2image import convert_from_path, pdfinfo_from_path
 import pandas as pd
 from openpyxl import load_workbook
-from docx import Document
+from packaging.version import Version
 
 from config.settings import settings
 from .extractors import (
@@ -19,9 +31,163 @@ from .extractors import (
     LeaseExtractor,
 )
 
-logging.basicConfig(level=logging.INFO)
+try:
+    import tesserocr
+except ImportError:  # tesserocr is an optional speed-up over pytesseract
+    tesserocr = None
+
+try:
+    import python_calamine
+except ImportError:  # python-calamine is an optional speed-up over openpyxl
+    python_calamine = None
+
+# pandas reads workbooks through the Rust calamine engine when it is installed;
+# it renders the same cell text as openpyxl at a fraction of the cost. The
+# engine only exists from pandas 2.2, while older releases are still allowed.
+_EXCEL_ENGINE = (
+    "calamine"
+    if python_calamine is not None and Version(pd.__version__) >= Version("2.2")
+    else "openpyxl"
+)
+
 logger = logging.getLogger(__name__)
 
+# Pages that yield fewer recognised characters than this at OCR_DPI are
+# rasterized again at OCR_RETRY_DPI, where small print is more legible.
+_MIN_PAGE_CHARS = 20
+
+# PDF pages with at least this many characters of embedded text are read
+# directly; only the rest are rasterized and OCRed.
+_MIN_EMBEDDED_CHARS_PER_PAGE = 50
+
+# Extracted text is kept for this many recently seen documents, keyed by a
+# digest of the file bytes, so re-uploads skip OCR entirely.
+_TEXT_CACHE_SIZE = 128
+
+# WordprocessingML tags read when pulling paragraph text out of a .docx
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_W_BODY = _W + "body"
+_W_P = _W + "p"
+_W_R = _W + "r"
+_W_HYPERLINK = _W + "hyperlink"
+_W_T = _W + "t"
+_W_BR = _W + "br"
+_W_BR_TYPE = _W + "type"
+# Other run content with a fixed text equivalent, as python-docx renders it
+_W_RUN_TEXT = {
+    _W + "tab": "\t",
+    _W + "ptab": "\t",
+    _W + "cr": "\n",
+    _W + "noBreakHyphen": "-",
+}
+
+_tess_local = threading.local()
+
+
+def _ocr_page(image_path: str) -> str:
+    """
+    Recognise the text of a single rasterized page.
+
+    With tesserocr installed each OCR worker thread keeps its own in-process
+    tesseract instance, so the language data is loaded once per thread instead
+    of once per page by a fresh subprocess.
+    """
+    if tesserocr is None:
+        # Pages are already recognised in parallel by the OCR pool, so keep each
+        # tesseract single-threaded; its OpenMP threads only contend with each
+        # other. The limit is set for the subprocess alone, not this process.
+        env = dict(os.environ)
+        env.setdefault("OMP_THREAD_LIMIT", "1")
+        result = subprocess.run(
+            [pytesseract.pytesseract.tesseract_cmd, image_path, "stdout"],
+            capture_output=True,
+            check=True,
+            env=env,
+        )
+        return result.stdout.decode("utf-8", errors="replace")
+
+    api = getattr(_tess_local, "api", None)
+    if api is None:
+        api = tesserocr.PyTessBaseAPI(lang="eng")
+        _tess_local.api = api
+    api.SetImageFile(image_path)
+    return api.GetUTF8Text()
+
+
+def _extract_embedded_text(file_path: str, poppler_path: Optional[str] = None) -> List[str]:
+    """
+    Return the text layer of each PDF page using poppler's pdftotext.
+
+    pdftotext ships with the same poppler utilities pdf2image drives, and
+    ``-layout`` keeps the column alignment the tabular extractors rely on.
+    Returns an empty list when the tool is unavailable or fails.
+    """
+    pdftotext = os.path.join(poppler_path, "pdftotext") if poppler_path else "pdftotext"
+    try:
+        result = subprocess.run(
+            [pdftotext, "-layout", "-enc", "UTF-8", file_path, "-"],
+            capture_output=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError) as e:
+        logger.debug(f"Embedded text extraction unavailable: {e}")
+        return []
+    # pdftotext ends every page with a form feed
+    return result.stdout.decode("utf-8", errors="replace").split("\f")[:-1]
+
+
+def _page_windows(pages: List[int], window: int) -> List[Tuple[int, int]]:
+    """Group sorted page numbers into runs of consecutive pages at most window long."""
+    windows: List[Tuple[int, int]] = []
+    for page in pages:
+        if windows:
+            first, last = windows[-1]
+            if page == last + 1 and page - first < window:
+                windows[-1] = (first, page)
+                continue
+        windows.append((page, page))
+    return windows
+
+
+def _file_digest(file_path: str) -> bytes:
+    """Hash a file's bytes in chunks without loading it all into memory."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(partial(f.read, 1 << 20), b""):
+            digest.update(chunk)
+    return digest.digest()
+
+
+def _run_text(run: ET.Element) -> str:
+    """Text of one w:r element; only line breaks, not page breaks, become newlines."""
+    parts = []
+    for element in run:
+        tag = element.tag
+        if tag == _W_T:
+            parts.append(element.text or "")
+        elif tag == _W_BR:
+            if element.get(_W_BR_TYPE, "textWrapping") == "textWrapping":
+                parts.append("\n")
+        elif tag in _W_RUN_TEXT:
+            parts.append(_W_RUN_TEXT[tag])
+    return "".join(parts)
+
+
+def _paragraph_text(paragraph: ET.Element) -> str:
+    """Text of one w:p element, including the runs inside hyperlinks."""
+    parts = []
+    for child in paragraph:
+        if child.tag == _W_R:
+            parts.append(_run_text(child))
+        elif child.tag == _W_HYPERLINK:
+            parts.extend(_run_text(run) for run in child.iterfind(_W_R))
+    return "".join(parts)
+
+
+def _run_extractor(extractor_cls: type, content: str) -> Dict[str, Any]:
+    """Run one extraction on a fresh extractor instance."""
+    return extractor_cls().extract(content)
+
 
 class DocumentProcessor:
     """Handles document processing with OCR and specialized data extraction."""
@@ -34,6 +200,11 @@ class DocumentProcessor:
             OperatingStatementExtractor(),
             LeaseExtractor(),
         ]
+        # Both pytesseract (a subprocess) and tesserocr (releases the GIL) let
+        # pages be recognised concurrently from threads; this pool, not
+        # tesseract's own threading, owns the page-level parallelism.
+        self._ocr_pool = ThreadPoolExecutor(max_workers=settings.MAX_WORKERS)
+        self._text_cache: "OrderedDict[Tuple[str, bytes], str]" = OrderedDict()
 
     async def process_document(self, file_path: str) -> Dict[str, Any]:
         """
@@ -48,7 +219,11 @@ class DocumentProcessor:
         try:
             logger.info(f"Starting document processing: {file_path}")
 
-            if not os.path.exists(file_path):
+            path = Path(file_path)
+            loop = asyncio.get_running_loop()
+            # stat() can block for a long time on network storage, so keep it
+            # off the event loop like the rest of the file I/O.
+            if not await loop.run_in_executor(self._ocr_pool, path.is_file):
                 logger.error(f"File not found: {file_path}")
                 return {
                     "status": "error",
@@ -56,14 +231,14 @@ class DocumentProcessor:
                     "processed_at": datetime.now().isoformat(),
                 }
 
-            file_extension = os.path.splitext(file_path)[1].lower()
+            file_extension = path.suffix.lower()
 
             if file_extension == ".pdf":
-                text_content = await self._process_pdf(file_path)
+                read_text = self._process_pdf
             elif file_extension == ".xlsx":
-                text_content = await self._process_excel(file_path)
+                read_text = self._process_excel
             elif file_extension == ".docx":
-                text_content = await self._process_word(file_path)
+                read_text = self._process_word
             else:
                 logger.error(f"Unsupported file type: {file_extension}")
                 return {
@@ -72,6 +247,21 @@ class DocumentProcessor:
                     "processed_at": datetime.now().isoformat(),
                 }
 
+            cache_key = (
+                file_extension,
+                await loop.run_in_executor(self._ocr_pool, _file_digest, file_path),
+            )
+            text_content = self._text_cache.get(cache_key)
+            if text_content is not None:
+                self._text_cache.move_to_end(cache_key)
+                logger.info(f"Reusing extracted text for identical file: {file_path}")
+            else:
+                text_content = await read_text(file_path)
+                if text_content:
+                    self._text_cache[cache_key] = text_content
+                    if len(self._text_cache) > _TEXT_CACHE_SIZE:
+                        self._text_cache.popitem(last=False)
+
             if not text_content:
                 return {
                     "status": "error",
@@ -79,21 +269,42 @@ class DocumentProcessor:
                     "processed_at": datetime.now().isoformat(),
                 }
 
-            extraction_results = []
-            filename = os.path.basename(file_path)
+            filename = path.name
+            # Lowercase once and share it across every extractor's can_handle
+            content_lower = text_content.lower()
 
+            matched = []
             for extractor in self.extractors:
-                if extractor.can_handle(text_content, filename):
+                # Only the yes/no answer is used here, so scoring extractors may
+                # stop scanning as soon as they are confident enough.
+                handled = extractor.can_handle(
+                    text_content, filename, content_lower=content_lower, need_full_score=False
+                )
+                # Some extractors report (can_handle, confidence) rather than a bool
+                if isinstance(handled, tuple):
+                    handled = handled[0]
+                if handled:
                     logger.info(f"Using {extractor.__class__.__name__}")
-                    result = extractor.extract(text_content)
-                    if result["success"]:
-                        extraction_results.append(
-                            {
-                                "extractor": extractor.__class__.__name__,
-                                "data": result["data"],
-                                "confidence": result["confidence_scores"],
-                            }
-                        )
+                    matched.append(extractor.__class__)
+
+            # Extraction is CPU-bound, so run it on the worker pool rather than the
+            # event loop. Each run gets a fresh extractor because extractors keep
+            # per-document state that concurrent requests must not share.
+            results = await asyncio.gather(
+                *(
+                    loop.run_in_executor(self._ocr_pool, _run_extractor, cls, text_content)
+                    for cls in matched
+                )
+            )
+            extraction_results = [
+                {
+                    "extractor": cls.__name__,
+                    "data": result["data"],
+                    "confidence": result["confidence_scores"],
+                }
+                for cls, result in zip(matched, results)
+                if result["success"]
+            ]
 
             return {
                 "status": "success",
@@ -111,22 +322,104 @@ class DocumentProcessor:
             }
 
     async def _process_pdf(self, file_path: str) -> Optional[str]:
-        """Process a PDF file using OCR."""
+        """Process a PDF file, falling back to OCR when it has no text layer."""
         try:
-            logger.info("Converting PDF to images...")
 
             poppler_path = settings.POPPLER_PATH if settings.is_poppler_configured else None
             convert_kwargs = {"poppler_path": poppler_path} if poppler_path else {}
 
-            images = convert_from_path(file_path, **convert_kwargs)
+            loop = asyncio.get_running_loop()
+            info = await loop.run_in_executor(
+                self._ocr_pool, partial(pdfinfo_from_path, file_path, **convert_kwargs)
+            )
+            page_count = info["Pages"]
+
+            text_content = await loop.run_in_executor(
+                self._ocr_pool, _extract_embedded_text, file_path, poppler_path
+            )
+            if len(text_content) != page_count:
+                text_content = [""] * page_count
+            # Decide page by page, so scanned exhibits bound into an otherwise
+            # digital document are still OCRed.
+            ocr_pages = [
+                page
+                for page, text in enumerate(text_content, start=1)
+                if len(text.strip()) < _MIN_EMBEDDED_CHARS_PER_PAGE
+            ]
+            if len(ocr_pages) < page_count:
+                logger.info(
+                    f"Using embedded text layer for {page_count - len(ocr_pages)} "
+                    f"of {page_count} pages"
+                )
+            if not ocr_pages:
+                return "\n".join(text_content)
+
+            window = settings.MAX_WORKERS
+
+            logger.info(f"Running OCR on {len(ocr_pages)} pages, {window} at a time")
+
+            retry_pages = []
+            with tempfile.TemporaryDirectory() as output_folder:
+                # Grayscale at a modest DPI keeps tesseract's per-page work, which
+                # scales with pixel count, well below the 200 DPI RGB default.
+                raster_kwargs = dict(
+                    output_folder=output_folder,
+                    paths_only=True,
+                    grayscale=True,
+                    **convert_kwargs,
+                )
+                # Rasterize one window of pages to disk at a time so peak memory
+                # is bounded by the window rather than the page count.
+                for first_page, last_page in _page_windows(ocr_pages, window):
+                    paths = await loop.run_in_executor(
+                        self._ocr_pool,
+                        partial(
+                            convert_from_path,
+                            file_path,
+                            dpi=settings.OCR_DPI,
+                            first_page=first_page,
+                            last_page=last_page,
+                            thread_count=window,
+                            **raster_kwargs,
+                        ),
+                    )
+                    texts = await asyncio.gather(
+                        *(
+                            loop.run_in_executor(self._ocr_pool, _ocr_page, path)
+                            for path in paths
+                        )
+                    )
+                    for page, text in enumerate(texts, start=first_page):
+                        text_content[page - 1] = text
+                    for path in paths:
+                        os.remove(path)
 
-            logger.info(f"Successfully converted PDF to {len(images)} images")
+                if settings.OCR_RETRY_DPI > settings.OCR_DPI:
+                    retry_pages = [
+                        page
+                        for page in ocr_pages
+                        if sum(c.isalnum() for c in text_content[page - 1]) < _MIN_PAGE_CHARS
+                    ]
+                for page in retry_pages:
+                    paths = await loop.run_in_executor(
+                        self._ocr_pool,
+                        partial(
+                            convert_from_path,
+                            file_path,
+                            dpi=settings.OCR_RETRY_DPI,
+                            first_page=page,
+                            last_page=page,
+                            **raster_kwargs,
+                        ),
+                    )
+                    for path in paths:
+                        text = await loop.run_in_executor(self._ocr_pool, _ocr_page, path)
+                        if len(text.strip()) > len(text_content[page - 1].strip()):
+                            text_content[page - 1] = text
+                        os.remove(path)
 
-            text_content = []
-            for i, img in enumerate(images):
-                logger.info(f"Processing page {i+1}/{len(images)}")
-                text = pytesseract.image_to_string(img)
-                text_content.append(text)
+            if retry_pages:
+                logger.info(f"Re-ran OCR at {settings.OCR_RETRY_DPI} DPI on pages {retry_pages}")
 
             return "\n".join(text_content)
 
@@ -137,14 +430,17 @@ class DocumentProcessor:
     async def _process_excel(self, file_path: str) -> Optional[str]:
         """Process an Excel file."""
         try:
-            xlsx = pd.ExcelFile(file_path)
-            sheets = []
+            xlsx = pd.ExcelFile(file_path, engine=_EXCEL_ENGINE)
+            buffer = io.StringIO()
 
-            for sheet_name in xlsx.sheet_names:
-                df = pd.read_excel(xlsx, sheet_name)
-                sheets.append(f"Sheet: {sheet_name}\n{df.to_string()}")
+            for i, sheet_name in enumerate(xlsx.sheet_names):
+                df = xlsx.parse(sheet_name)
+                if i:
+                    buffer.write("\n\n")
+                buffer.write(f"Sheet: {sheet_name}\n")
+                df.to_string(buffer)
 
-            return "\n\n".join(sheets)
+            return buffer.getvalue()
 
         except Exception as e:
             logger.error(f"Error processing Excel file: {str(e)}")
@@ -153,9 +449,15 @@ class DocumentProcessor:
     async def _process_word(self, file_path: str) -> Optional[str]:
         """Process a Word document."""
         try:
-            doc = Document(file_path)
-            paragraphs = [paragraph.text for paragraph in doc.paragraphs]
-            return "\n".join(paragraphs)
+            # Read the body paragraphs straight from document.xml. This yields the
+            # same text as python-docx's Document.paragraphs without building its
+            # object model for every part, paragraph and run.
+            with zipfile.ZipFile(file_path) as archive:
+                root = ET.fromstring(archive.read("word/document.xml"))
+            return "\n".join(
+                _paragraph_text(paragraph)
+                for paragraph in root.find(_W_BODY).iterfind(_W_P)
+            )
 
         except Exception as e:
             logger.error(f"Error processing Word document: {str(e)}")
@@ -1,4 +1,8 @@
 from enum import Enum
+import threading
+import time
+from collections import Counter, OrderedDict
+from dataclasses import asdict, dataclass
 from pydantic import BaseModel, Field
 from datetime import datetime
 from typing import Optional, Dict, Any, List
@@ -68,11 +72,137 @@ class DocumentProcessingStatus(BaseModel):
         populate_by_name = True
 
 
+# Mutable records backing the tracker. They mirror the pydantic models above
+# field for field but use __slots__ and plain attribute access; models are
+# only built, under the tracker lock, when a status is handed to a caller.
+
+
+@dataclass
+class _ExtractorState:
+    __slots__ = ("extractor", "status", "started_at", "completed_at", "confidence", "error")
+
+    extractor: str
+    status: ProcessingStatus
+    started_at: Optional[datetime]
+    completed_at: Optional[datetime]
+    confidence: Optional[float]
+    error: Optional[str]
+
+    def to_model(self) -> ExtractorStatus:
+        return ExtractorStatus.model_validate(asdict(self))
+
+
+@dataclass
+class _StepState:
+    __slots__ = (
+        "step",
+        "status",
+        "started_at",
+        "completed_at",
+        "duration_ms",
+        "details",
+        "completed_mono_ns",
+    )
+
+    step: str
+    status: ProcessingStatus
+    started_at: datetime
+    completed_at: Optional[datetime]
+    duration_ms: Optional[int]
+    details: Optional[Dict[str, Any]]
+    # Monotonic clock reading at completion, used for durations
+    completed_mono_ns: Optional[int]
+
+    def to_model(self) -> ProcessingStep:
+        return ProcessingStep.model_validate(asdict(self))
+
+
+@dataclass
+class _HistoryState:
+    __slots__ = ("document_id", "steps", "started_at", "completed_at", "total_duration_ms")
+
+    document_id: str
+    steps: List[_StepState]
+    started_at: datetime
+    completed_at: Optional[datetime]
+    total_duration_ms: Optional[int]
+
+
+@dataclass
+class _DocumentState:
+    __slots__ = (
+        "id",
+        "filename",
+        "status",
+        "progress_percentage",
+        "current_step",
+        "extractor_statuses",
+        "history",
+        "error",
+        "created_at",
+        "updated_at",
+        "completed_at",
+        "extractor_index",
+        "created_mono_ns",
+        "cached_mono_ns",
+    )
+
+    id: str
+    filename: str
+    status: ProcessingStatus
+    progress_percentage: int
+    current_step: Optional[str]
+    extractor_statuses: List[_ExtractorState]
+    history: Optional[_HistoryState]
+    error: Optional[str]
+    created_at: datetime
+    updated_at: datetime
+    completed_at: Optional[datetime]
+    # extractor name -> the state also held in extractor_statuses
+    extractor_index: Dict[str, _ExtractorState]
+    # Monotonic clock reading corresponding to created_at, used for durations
+    created_mono_ns: int
+    # Monotonic clock reading when the tracker stored the status, used for expiry
+    cached_mono_ns: int
+
+    def to_model(self) -> DocumentProcessingStatus:
+        data = asdict(self)
+        del data["extractor_index"]
+        return DocumentProcessingStatus.model_validate(data)
+
+
+# Bounds on the tracker's cache: the most statuses kept, and how long after a
+# status was stored it may still be read.
+_STATUS_CACHE_SIZE = 10_000
+_STATUS_TTL_NS = 24 * 60 * 60 * 1_000_000_000
+
+
 class ProcessingStatusTracker:
     """Tracks document processing status throughout the pipeline."""
 
     def __init__(self):
-        self._status_cache: Dict[str, DocumentProcessingStatus] = {}
+        # Insertion-ordered, so the oldest statuses are evicted from the front
+        self._status_cache: "OrderedDict[str, _DocumentState]" = OrderedDict()
+        self._lock = threading.RLock()
+
+    def _get(self, document_id: str) -> Optional[_DocumentState]:
+        """Look up a live status, treating expired entries as missing."""
+        doc_status = self._status_cache.get(document_id)
+        if doc_status is None:
+            return None
+        if time.monotonic_ns() - doc_status.cached_mono_ns > _STATUS_TTL_NS:
+            return None
+        return doc_status
+
+    def _evict(self):
+        """Drop expired statuses and the oldest ones beyond the size bound."""
+        cutoff = time.monotonic_ns() - _STATUS_TTL_NS
+        cache = self._status_cache
+        while cache:
+            oldest = next(iter(cache.values()))
+            if len(cache) <= _STATUS_CACHE_SIZE and oldest.cached_mono_ns >= cutoff:
+                break
+            cache.popitem(last=False)
 
     def create_status(
         self,
@@ -81,16 +211,34 @@ class ProcessingStatusTracker:
         created_at: datetime = None,
     ) -> DocumentProcessingStatus:
         """Create initial processing status for a document."""
-        status = DocumentProcessingStatus(
+        now = datetime.now()
+        cached_mono_ns = created_mono_ns = time.monotonic_ns()
+        if created_at is not None:
+            # Compare in created_at's own zone so aware timestamps (e.g. UTC
+            # from Mongo) work as well as naive local ones.
+            elapsed = datetime.now(created_at.tzinfo) - created_at
+            created_mono_ns -= int(elapsed.total_seconds() * 1_000_000_000)
+        status = _DocumentState(
             id=document_id,
             filename=filename,
             status=ProcessingStatus.PENDING,
             progress_percentage=0,
-            created_at=created_at or datetime.now(),
-            updated_at=datetime.now(),
+            current_step=None,
+            extractor_statuses=[],
+            history=None,
+            error=None,
+            created_at=created_at or now,
+            updated_at=now,
+            completed_at=None,
+            extractor_index={},
+            created_mono_ns=created_mono_ns,
+            cached_mono_ns=cached_mono_ns,
         )
-        self._status_cache[document_id] = status
-        return status
+        with self._lock:
+            self._status_cache.pop(document_id, None)
+            self._status_cache[document_id] = status
+            self._evict()
+            return status.to_model()
 
     def update_status(
         self,
@@ -101,24 +249,26 @@ class ProcessingStatusTracker:
         error: str = None,
     ) -> Optional[DocumentProcessingStatus]:
         """Update processing status."""
-        if document_id not in self._status_cache:
-            return None
+        with self._lock:
+            doc_status = self._get(document_id)
+            if doc_status is None:
+                return None
 
-        doc_status = self._status_cache[document_id]
-        doc_status.status = status
-        doc_status.updated_at = datetime.now()
+            now = datetime.now()
+            doc_status.status = status
+            doc_status.updated_at = now
 
-        if progress_percentage is not None:
-            doc_status.progress_percentage = progress_percentage
-        if current_step is not None:
-            doc_status.current_step = current_step
-        if error is not None:
-            doc_status.error = error
+            if progress_percentage is not None:
+                doc_status.progress_percentage = progress_percentage
+            if current_step is not None:
+                doc_status.current_step = current_step
+            if error is not None:
+                doc_status.error = error
 
-        if status == ProcessingStatus.COMPLETED:
-            doc_status.completed_at = datetime.now()
+            if status == ProcessingStatus.COMPLETED:
+                doc_status.completed_at = now
 
-        return doc_status
+            return doc_status.to_model()
 
     def add_extractor_status(
         self,
@@ -129,37 +279,35 @@ class ProcessingStatusTracker:
         error: str = None,
     ) -> Optional[ExtractorStatus]:
         """Add or update extractor status."""
-        if document_id not in self._status_cache:
-            return None
-
-        doc_status = self._status_cache[document_id]
-
-        existing = next(
-            (e for e in doc_status.extractor_statuses if e.extractor == extractor),
-            None,
-        )
+        with self._lock:
+            doc_status = self._get(document_id)
+            if doc_status is None:
+                return None
+
+            existing = doc_status.extractor_index.get(extractor)
+            now = datetime.now()
+            completed_at = (
+                now if status in [ProcessingStatus.COMPLETED, ProcessingStatus.ERROR] else None
+            )
 
-        if existing:
-            existing.status = status
-            existing.confidence = confidence
-            existing.error = error
-            existing.completed_at = (
-                datetime.now() if status in [ProcessingStatus.COMPLETED, ProcessingStatus.ERROR] else None
+            if existing:
+                existing.status = status
+                existing.confidence = confidence
+                existing.error = error
+                existing.completed_at = completed_at
+                return existing.to_model()
+
+            new_extractor = _ExtractorState(
+                extractor=extractor,
+                status=status,
+                started_at=now,
+                confidence=confidence,
+                error=error,
+                completed_at=completed_at,
             )
-            return existing
-
-        new_extractor = ExtractorStatus(
-            extractor=extractor,
-            status=status,
-            started_at=datetime.now(),
-            confidence=confidence,
-            error=error,
-            completed_at=(
-                datetime.now() if status in [ProcessingStatus.COMPLETED, ProcessingStatus.ERROR] else None
-            ),
-        )
-        doc_status.extractor_statuses.append(new_extractor)
-        return new_extractor
+            doc_status.extractor_statuses.append(new_extractor)
+            doc_status.extractor_index[extractor] = new_extractor
+            return new_extractor.to_model()
 
     def start_extractor(self, document_id: str, extractor: str) -> Optional[ExtractorStatus]:
         """Mark extractor as started."""
@@ -189,44 +337,51 @@ class ProcessingStatusTracker:
         details: Dict[str, Any] = None,
     ) -> Optional[ProcessingStep]:
         """Add a step to processing history."""
-        if document_id not in self._status_cache:
-            return None
-
-        doc_status = self._status_cache[document_id]
+        with self._lock:
+            doc_status = self._get(document_id)
+            if doc_status is None:
+                return None
+
+            if doc_status.history is None:
+                doc_status.history = _HistoryState(
+                    document_id=document_id,
+                    steps=[],
+                    started_at=doc_status.created_at,
+                    completed_at=None,
+                    total_duration_ms=None,
+                )
 
-        if doc_status.history is None:
-            doc_status.history = ProcessingHistory(
-                document_id=document_id,
-                started_at=doc_status.created_at,
+            now = datetime.now()
+            new_step = _StepState(
+                step=step,
+                status=status,
+                started_at=now,
+                completed_at=None,
+                duration_ms=None,
+                details=details,
+                completed_mono_ns=None,
             )
+            steps = doc_status.history.steps
+            previous = steps[-1] if steps else None
+            steps.append(new_step)
 
-        new_step = ProcessingStep(
-            step=step,
-            status=status,
-            started_at=datetime.now(),
-            details=details,
-        )
-        doc_status.history.steps.append(new_step)
-
-        if status == ProcessingStatus.COMPLETED:
-            new_step.completed_at = datetime.now()
-            if doc_status.history.steps:
-                previous = doc_status.history.steps[-2] if len(doc_status.history.steps) > 1 else None
-                if previous and previous.completed_at:
-                    new_step.duration_ms = int(
-                        (new_step.completed_at - previous.completed_at).total_seconds() * 1000
-                    )
+            if status == ProcessingStatus.COMPLETED:
+                new_step.completed_at = now
+                new_step.completed_mono_ns = time.monotonic_ns()
+                if previous and previous.completed_mono_ns is not None:
+                    new_step.duration_ms = (
+                        new_step.completed_mono_ns - previous.completed_mono_ns
+                    ) // 1_000_000
 
-        self._update_progress(document_id)
-        return new_step
+            self._update_progress(document_id)
+            return new_step.to_model()
 
     def _update_progress(self, document_id: str):
         """Update overall progress percentage."""
-        if document_id not in self._status_cache:
+        doc_status = self._get(document_id)
+        if doc_status is None:
             return
 
-        doc_status = self._status_cache[document_id]
-
         if not doc_status.history or not doc_status.history.steps:
             return
 
@@ -242,52 +397,60 @@ class ProcessingStatusTracker:
 
     def get_status(self, document_id: str) -> Optional[DocumentProcessingStatus]:
         """Get current processing status."""
-        return self._status_cache.get(document_id)
+        with self._lock:
+            doc_status = self._get(document_id)
+            return doc_status.to_model() if doc_status is not None else None
 
     def finalize_status(
         self, document_id: str, success: bool = True, error: str = None
     ) -> Optional[DocumentProcessingStatus]:
         """Finalize processing status."""
-        if document_id not in self._status_cache:
-            return None
-
-        doc_status = self._status_cache[document_id]
-
-        if success:
-            doc_status.status = ProcessingStatus.COMPLETED
-            doc_status.progress_percentage = 100
-        else:
-            doc_status.status = ProcessingStatus.ERROR
-            doc_status.error = error
-
-        doc_status.completed_at = datetime.now()
-        doc_status.updated_at = datetime.now()
-
-        if doc_status.history:
-            doc_status.history.completed_at = datetime.now()
-            if doc_status.history.started_at and doc_status.completed_at:
-                doc_status.history.total_duration_ms = int(
-                    (doc_status.completed_at - doc_status.history.started_at).total_seconds() * 1000
-                )
-
-        return doc_status
+        with self._lock:
+            doc_status = self._get(document_id)
+            if doc_status is None:
+                return None
+
+            if success:
+                doc_status.status = ProcessingStatus.COMPLETED
+                doc_status.progress_percentage = 100
+            else:
+                doc_status.status = ProcessingStatus.ERROR
+                doc_status.error = error
+
+            now = datetime.now()
+            doc_status.completed_at = now
+            doc_status.updated_at = now
+
+            if doc_status.history:
+                doc_status.history.completed_at = now
+                doc_status.history.total_duration_ms = (
+                    time.monotonic_ns() - doc_status.created_mono_ns
+                ) // 1_000_000
+
+            return doc_status.to_model()
 
     def remove_status(self, document_id: str):
         """Remove status from cache."""
-        if document_id in self._status_cache:
-            del self._status_cache[document_id]
+        with self._lock:
+            self._status_cache.pop(document_id, None)
+
+    def _live_statuses(self) -> List[_DocumentState]:
+        """Snapshot the unexpired statuses."""
+        with self._lock:
+            self._evict()
+            return list(self._status_cache.values())
 
     def get_all_statuses(self) -> List[DocumentProcessingStatus]:
         """Get all cached statuses."""
-        return list(self._status_cache.values())
+        with self._lock:
+            return [doc_status.to_model() for doc_status in self._live_statuses()]
 
-   (self) -> Dict:
-        """Get summary def get_status_summary of all processing statuses."""
-        statuses = self.get_all_statuses()
+    def get_status_summary(self) -> Dict:
+        """Get summary of all processing statuses."""
+        statuses = self._live_statuses()
 
-        by_status = {status: 0 for status in ProcessingStatus}
-        for status in statuses:
-            by_status[status.status] += 1
+        counts = Counter(s.status for s in statuses)
+        by_status = {status: counts[status] for status in ProcessingStatus}
 
         return {
             "total_documents": len(statuses),
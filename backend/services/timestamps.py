@@ -0,0 +1,22 @@
+"""
+Cheap ISO-8601 UTC timestamps for log records.
+
+Formatting a datetime with isoformat() on every log line is
+comparatively expensive. The second-resolution prefix only changes once per
+second, so it is cached per thread and only the milliseconds are formatted on
+each call.
+"""
+
+import threading
+import time
+
+_local = threading.local()
+
+
+def iso_utc(timestamp: float) -> str:
+    """Format a POSIX timestamp as ``YYYY-MM-DDTHH:MM:SS.mmmZ`` in UTC."""
+    second = int(timestamp)
+    if getattr(_local, "second", None) != second:
+        _local.second = second
+        _local.prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+    return f"{_local.prefix}.{int((timestamp - second) * 1000):03d}Z"
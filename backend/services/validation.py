@@ -1,16 +1,26 @@
 import logging
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
+from typing import Dict, List, Mapping, Optional, Any, Tuple, Union
+from dataclasses import dataclass, field
 from datetime import datetime
+from enum import Enum
+from types import MappingProxyType
 
 logger = logging.getLogger(__name__)
 
 
+class Severity(str, Enum):
+    """Validation issue severity levels."""
+
+    CRITICAL = "critical"
+    WARNING = "warning"
+    INFO = "info"
+
+
 @dataclass
 class ValidationIssue:
     """Represents a validation issue found in extracted data."""
 
-    severity: str
+    severity: Severity
     field: str
     message: str
     current_value: Any
@@ -25,38 +35,85 @@ class ValidationResult:
     is_valid: bool
     issues: List[ValidationIssue]
     confidence_score: float
-    validated_at: datetime = datetime.now()
+    validated_at: datetime = field(default_factory=datetime.now)
+
+    def __post_init__(self):
+        # Per-severity summaries of self.issues, kept current by add_issue
+        self._tally_issues()
+
+    def _tally_issues(self):
+        self._by_severity: Dict[str, List[Dict]] = {s.value: [] for s in Severity}
+        for issue in self.issues:
+            self._by_severity.setdefault(issue.severity, []).append(
+                {"field": issue.field, "message": issue.message}
+            )
 
     def add_issue(self, issue: ValidationIssue):
         """Add a validation issue."""
         self.issues.append(issue)
-        self._recalculate_validity()
+        self._by_severity.setdefault(issue.severity, []).append(
+            {"field": issue.field, "message": issue.message}
+        )
+        if issue.severity == Severity.CRITICAL:
+            self.is_valid = False
 
     def _recalculate_validity(self):
-        """Recalculate validity based on issues."""
-        critical_issues = [i for i in self.issues if i.severity == "critical"]
-        self.is_valid = len(critical_issues) == 0
+        """Recalculate validity and tallies after issues were modified directly."""
+        self.is_valid = not any(i.severity == Severity.CRITICAL for i in self.issues)
+        self._tally_issues()
+
+    def severity_count(self, severity: str) -> int:
+        """Number of issues recorded with the given severity."""
+        return len(self._by_severity.get(severity, ()))
 
     def get_summary(self) -> Dict:
         """Get validation summary."""
-        by_severity = {"critical": [], "warning": [], "info": []}
-        for issue in self.issues:
-            by_severity[issue.severity].append(
-                {"field": issue.field, "message": issue.message}
-            )
+        return self._summary(
+            {severity: list(entries) for severity, entries in self._by_severity.items()}
+        )
 
+    def _summary(self, by_severity: Optional[Dict[str, List[Dict]]] = None) -> Dict:
+        """Build the summary, sharing the live severity lists unless given copies."""
         return {
             "is_valid": self.is_valid,
             "total_issues": len(self.issues),
-            "by_severity": by_severity,
+            "by_severity": self._by_severity if by_severity is None else by_severity,
             "confidence_score": self.confidence_score,
         }
 
 
+def _range_checks(
+    rules: Mapping[str, Dict], *fields: Union[str, Tuple[str, str]]
+) -> Tuple[Tuple[str, Optional[float], Optional[float], Severity], ...]:
+    """
+    Resolve fields to (field, min, max, severity) range checks from rules.
+
+    An entry is a field name, or a (field, rule name) pair when the field's
+    bounds are kept under another name. Severity follows the field's own
+    rule; a field without one need only be non-negative and just warns.
+    """
+    checks = []
+    for entry in fields:
+        name, rule_name = (entry, entry) if isinstance(entry, str) else entry
+        bounds = rules.get(rule_name, {"min": 0, "max": None})
+        critical = rules.get(name, {}).get("critical", False)
+        checks.append(
+            (
+                name,
+                bounds["min"],
+                bounds["max"],
+                Severity.CRITICAL if critical else Severity.WARNING,
+            )
+        )
+    return tuple(checks)
+
+
 class DocumentValidator:
     """Validates extracted document data for quality and consistency."""
 
-    RULES = {
+    __slots__ = ("confidence_threshold",)
+
+    RULES = MappingProxyType({
         "occupancy_rate": {"min": 0, "max": 100, "critical": True},
         "dscr": {"min": 0, "max": 10, "critical": False},
         "cap_rate": {"min": 0, "max": 20, "critical": False},
@@ -67,20 +124,65 @@ class DocumentValidator:
         "total_expenses": {"min": 0, "max": None, "critical": True},
         "tenant_count": {"min": 0, "max": None, "critical": False},
         "occupancy_rate_change": {"min": -50, "max": 50, "critical": False},
-    }
+    })
+
+    # Thresholds for the tiered and cross-field rules
+    EXPENSE_RATIO_WARNING = 80
+    DSCR_CRITICAL = 1.0
+    DSCR_WARNING = 1.25
+    LTV_CRITICAL = 80
+    LTV_WARNING = 75
+    OCCUPANCY_CRITICAL = 70
+    OCCUPANCY_WARNING = 85
+    OCCUPANCY_MISMATCH_THRESHOLD = 10
+
+    # Plain range checks run by each validator, resolved once from RULES; only
+    # cross-field and tiered rules are written out in the validators.
+    _NUMERIC_CHECKS = MappingProxyType({
+        "rent_roll": _range_checks(
+            RULES, "total_units", "occupancy_rate", "total_monthly_rent"
+        ),
+        "pl": _range_checks(
+            RULES, "gross_income", "total_expenses", "noi", "expense_ratio"
+        ),
+        "metrics": _range_checks(
+            RULES,
+            "noi",
+            "dscr",
+            ("capRate", "cap_rate"),
+            "ltv",
+            ("occupancyRate", "occupancy_rate"),
+        ),
+    })
 
     def __init__(self, confidence_threshold: float = 0.7):
         """Initialize validator with configurable confidence threshold."""
         self.confidence_threshold = confidence_threshold
 
-    def validate_rent_roll(self, data: Dict) -> ValidationResult:
-        """Validate rent roll extracted data."""
-        result = ValidationResult(is_valid=True, issues=[], confidence_score=1.0)
+    def validate_rent_roll(
+        self,
+        data: Dict,
+        fast_fail: bool = False,
+        validated_at: Optional[datetime] = None,
+    ) -> ValidationResult:
+        """
+        Validate rent roll extracted data.
+
+        With fast_fail, stop at the first critical issue; the result then only
+        reliably answers is_valid and may omit later issues. validated_at lets
+        a caller stamp several results with one timestamp.
+        """
+        result = ValidationResult(
+            is_valid=True,
+            issues=[],
+            confidence_score=1.0,
+            validated_at=validated_at or datetime.now(),
+        )
 
         if not data.get("tenants"):
             result.add_issue(
                 ValidationIssue(
-                    severity="critical",
+                    severity=Severity.CRITICAL,
                     field="tenants",
                     message="No tenant data found",
                     current_value=None,
@@ -92,39 +194,50 @@ class DocumentValidator:
         summary = data.get("summary", {})
         tenant_count = len(data["tenants"])
 
-        self._validate_numeric_field(
-            result, "total_units", summary.get("total_units", 0), (0, None)
-        )
-        self._validate_numeric_field(
-            result, "occupancy_rate", summary.get("occupancy_rate", 0), (0, 100)
-        )
-        self._validate_numeric_field(
-            result, "total_monthly_rent", summary.get("total_monthly_rent", 0), (0, None)
-        )
+        self._run_numeric_checks(result, summary, self._NUMERIC_CHECKS["rent_roll"])
 
+        # Most tenants are clean, so only hand the records that fail the screen
+        # to _validate_tenant_record.
         for i, tenant in enumerate(data["tenants"]):
-            self._validate_tenant_record(result, tenant, i)
+            if fast_fail and not result.is_valid:
+                break
+            if self._tenant_needs_review(tenant):
+                self._validate_tenant_record(result, tenant, i)
 
-        result.confidence_score = self._calculate_confidence(result.issues, tenant_count)
+        result.confidence_score = self._calculate_confidence(result, tenant_count)
         return result
 
-    def validate_pl_statement(self, data: Dict) -> ValidationResult:
-        """Validate P&L statement extracted data."""
-        result = ValidationResult(is_valid=True, issues=[], confidence_score=1.0)
+    def validate_pl_statement(
+        self,
+        data: Dict,
+        fast_fail: bool = False,
+        validated_at: Optional[datetime] = None,
+    ) -> ValidationResult:
+        """Validate P&L statement extracted data; see validate_rent_roll for the options."""
+        result = ValidationResult(
+            is_valid=True,
+            issues=[],
+            confidence_score=1.0,
+            validated_at=validated_at or datetime.now(),
+        )
 
         summary = data.get("summary", {})
         revenue = summary.get("gross_income", 0)
         expenses = summary.get("total_expenses", 0)
         noi = summary.get("noi", 0)
 
-        self._validate_numeric_field(result, "gross_income", revenue, (0, None))
-        self._validate_numeric_field(result, "total_expenses", expenses, (0, None))
-        self._validate_numeric_field(result, "noi", noi, (0, None))
+        self._run_numeric_checks(result, summary, self._NUMERIC_CHECKS["pl"])
+
+        if fast_fail and not result.is_valid:
+            result.confidence_score = self._calculate_confidence(
+                result, len(data.get("revenue", {}).get("items", []))
+            )
+            return result
 
         if expenses > revenue:
             result.add_issue(
                 ValidationIssue(
-                    severity="critical",
+                    severity=Severity.CRITICAL,
                     field="noi",
                     message="Expenses exceed revenue - NOI should be positive",
                     current_value=noi,
@@ -134,98 +247,110 @@ class DocumentValidator:
             )
 
         expense_ratio = summary.get("expense_ratio", 0)
-        self._validate_numeric_field(
-            result, "expense_ratio", expense_ratio, (0, 100)
-        )
-
-        if expense_ratio > 80:
+        if expense_ratio > self.EXPENSE_RATIO_WARNING:
             result.add_issue(
                 ValidationIssue(
-                    severity="warning",
+                    severity=Severity.WARNING,
                     field="expense_ratio",
                     message=f"High expense ratio: {expense_ratio}%",
                     current_value=expense_ratio,
-                    suggested_value="Expected < 80%",
+                    suggested_value=f"Expected < {self.EXPENSE_RATIO_WARNING}%",
                 )
             )
 
         result.confidence_score = self._calculate_confidence(
-            result.issues, len(data.get("revenue", {}).get("items", []))
+            result, len(data.get("revenue", {}).get("items", []))
         )
         return result
 
-    def validate_financial_metrics(self, metrics: Dict) -> ValidationResult:
-        """Validate financial analysis metrics."""
-        result = ValidationResult(is_valid=True, issues=[], confidence_score=1.0)
-
-        self._validate_numeric_field(result, "noi", metrics.get("noi", 0), (0, None))
-        self._validate_numeric_field(result, "dscr", metrics.get("dscr", 0), (0, 10))
-        self._validate_numeric_field(result, "capRate", metrics.get("capRate", 0), (0, 20))
-        self._validate_numeric_field(result, "ltv", metrics.get("ltv", 0), (0, 100))
-        self._validate_numeric_field(
-            result, "occupancyRate", metrics.get("occupancyRate", 0), (0, 100)
+    def validate_financial_metrics(
+        self,
+        metrics: Dict,
+        fast_fail: bool = False,
+        validated_at: Optional[datetime] = None,
+    ) -> ValidationResult:
+        """Validate financial analysis metrics; see validate_rent_roll for the options."""
+        result = ValidationResult(
+            is_valid=True,
+            issues=[],
+            confidence_score=1.0,
+            validated_at=validated_at or datetime.now(),
         )
 
+        self._run_numeric_checks(result, metrics, self._NUMERIC_CHECKS["metrics"])
+
+        if fast_fail and not result.is_valid:
+            return result
+
         dscr = metrics.get("dscr", 0)
-        if dscr < 1.0:
+        if dscr < self.DSCR_CRITICAL:
             result.add_issue(
                 ValidationIssue(
-                    severity="critical",
+                    severity=Severity.CRITICAL,
                     field="dscr",
-                    message=f"DSCR below 1.0 - negative cash flow: {dscr}",
+                    message=f"DSCR below {self.DSCR_CRITICAL} - negative cash flow: {dscr}",
                     current_value=dscr,
-                    suggested_value="Expected > 1.0",
-                    rule="DSCR >= 1.0",
+                    suggested_value=f"Expected > {self.DSCR_CRITICAL}",
+                    rule=f"DSCR >= {self.DSCR_CRITICAL}",
                 )
             )
-        elif dscr < 1.25:
+        elif dscr < self.DSCR_WARNING:
             result.add_issue(
                 ValidationIssue(
-                    severity="warning",
+                    severity=Severity.WARNING,
                     field="dscr",
-                    message=f"DSCR below 1.25 - tight coverage: {dscr}",
+                    message=f"DSCR below {self.DSCR_WARNING} - tight coverage: {dscr}",
                     current_value=dscr,
-                    suggested_value="Expected > 1.25",
+                    suggested_value=f"Expected > {self.DSCR_WARNING}",
                 )
             )
 
+        if fast_fail and not result.is_valid:
+            return result
+
         ltv = metrics.get("ltv", 0)
-        if ltv > 80:
+        if ltv > self.LTV_CRITICAL:
             result.add_issue(
                 ValidationIssue(
-                    severity="critical",
+                    severity=Severity.CRITICAL,
                     field="ltv",
-                    message=f"LTV above 80% - excessive leverage: {ltv}%",
+                    message=f"LTV above {self.LTV_CRITICAL}% - excessive leverage: {ltv}%",
                     current_value=ltv,
-                    suggested_value="Expected < 80%",
+                    suggested_value=f"Expected < {self.LTV_CRITICAL}%",
                 )
             )
-        elif ltv > 75:
+        elif ltv > self.LTV_WARNING:
             result.add_issue(
                 ValidationIssue(
-                    severity="warning",
+                    severity=Severity.WARNING,
                     field="ltv",
-                    message=f"LTV above 75% - high leverage: {ltv}%",
+                    message=f"LTV above {self.LTV_WARNING}% - high leverage: {ltv}%",
                     current_value=ltv,
                 )
             )
 
+        if fast_fail and not result.is_valid:
+            return result
+
         occupancy = metrics.get("occupancyRate", 0)
-        if occupancy < 70:
+        if occupancy < self.OCCUPANCY_CRITICAL:
             result.add_issue(
                 ValidationIssue(
-                    severity="critical",
+                    severity=Severity.CRITICAL,
                     field="occupancyRate",
-                    message=f"Occupancy below 70% - high vacancy risk: {occupancy}%",
+                    message=(
+                        f"Occupancy below {self.OCCUPANCY_CRITICAL}% - "
+                        f"high vacancy risk: {occupancy}%"
+                    ),
                     current_value=occupancy,
                 )
             )
-        elif occupancy < 85:
+        elif occupancy < self.OCCUPANCY_WARNING:
             result.add_issue(
                 ValidationIssue(
-                    severity="warning",
+                    severity=Severity.WARNING,
                     field="occupancyRate",
-                    message=f"Occupancy below 85%: {occupancy}%",
+                    message=f"Occupancy below {self.OCCUPANCY_WARNING}%: {occupancy}%",
                     current_value=occupancy,
                 )
             )
@@ -233,71 +358,94 @@ class DocumentValidator:
         return result
 
     def validate_cross_field_consistency(
-        self, rent_roll_data: Dict, pl_data: Dict, financial_metrics: Dict
+        self,
+        rent_roll_data: Dict,
+        pl_data: Dict,
+        financial_metrics: Dict,
+        validated_at: Optional[datetime] = None,
     ) -> ValidationResult:
         """Validate consistency across different data sources."""
-        result = ValidationResult(is_valid=True, issues=[], confidence_score=1.0)
+        result = ValidationResult(
+            is_valid=True,
+            issues=[],
+            confidence_score=1.0,
+            validated_at=validated_at or datetime.now(),
+        )
 
         rent_roll_occupancy = rent_roll_data.get("summary", {}).get("occupancy_rate", 0)
         metric_occupancy = financial_metrics.get("occupancyRate", 0)
 
-        if rent_roll_occupancy and metric_occupancy:
-            diff = abs(rent_roll_occupancy - metric_occupancy)
-            if diff > 10:
-                result.add_issue(
-                    ValidationIssue(
-                        severity="warning",
-                        field="occupancyRate",
-                        message=f"Occupancy mismatch between rent roll ({rent_roll_occupancy}%) and metrics ({metric_occupancy}%)",
-                        current_value=metric_occupancy,
-                        suggested_value=rent_roll_occupancy,
-                    )
+        if (
+            rent_roll_occupancy
+            and metric_occupancy
+            and abs(rent_roll_occupancy - metric_occupancy) > self.OCCUPANCY_MISMATCH_THRESHOLD
+        ):
+            result.add_issue(
+                ValidationIssue(
+                    severity=Severity.WARNING,
+                    field="occupancyRate",
+                    message=f"Occupancy mismatch between rent roll ({rent_roll_occupancy}%) and metrics ({metric_occupancy}%)",
+                    current_value=metric_occupancy,
+                    suggested_value=rent_roll_occupancy,
                 )
+            )
 
         return result
 
-    def _validate_numeric_field(
-        self,
-        result: ValidationResult,
-        field: str,
-        value: float,
-        valid_range: tuple,
+    def _run_numeric_checks(
+        self, result: ValidationResult, values: Dict, checks: tuple
     ):
-        """Validate a numeric field against a range."""
-        min_val, max_val = valid_range
+        """Range-check each (field, min, max, severity) entry against values."""
+        add_issue = result.add_issue
+        for name, min_val, max_val, severity in checks:
+            value = values.get(name, 0)
 
-        if value is None:
-            result.add_issue(
-                ValidationIssue(
-                    severity="critical" if self.RULES.get(field, {}).get("critical") else "warning",
-                    field=field,
-                    message=f"Missing required field: {field}",
-                    current_value=None,
+            if value is None:
+                add_issue(
+                    ValidationIssue(
+                        severity=severity,
+                        field=name,
+                        message=f"Missing required field: {name}",
+                        current_value=None,
+                    )
                 )
-            )
-            return
+                continue
 
-        if min_val is not None and value < min_val:
-            result.add_issue(
-                ValidationIssue(
-                    severity="critical" if self.RULES.get(field, {}).get("critical") else "warning",
-                    field=field,
-                    message=f"Value below minimum: {value} < {min_val}",
-                    current_value=value,
-                    suggested_value=min_val,
+            if min_val is not None and value < min_val:
+                add_issue(
+                    ValidationIssue(
+                        severity=severity,
+                        field=name,
+                        message=f"Value below minimum: {value} < {min_val}",
+                        current_value=value,
+                        suggested_value=min_val,
+                    )
                 )
-            )
 
-        if max_val is not None and value > max_val:
-            result.add_issue(
-                ValidationIssue(
-                    severity="critical" if self.RULES.get(field, {}).get("critical") else "warning",
-                    field=field,
-                    message=f"Value above maximum: {value} > {max_val}",
-                    current_value=value,
-                    suggested_value=max_val,
+            if max_val is not None and value > max_val:
+                add_issue(
+                    ValidationIssue(
+                        severity=severity,
+                        field=name,
+                        message=f"Value above maximum: {value} > {max_val}",
+                        current_value=value,
+                        suggested_value=max_val,
+                    )
                 )
-            )
+
+    @staticmethod
+    def _tenant_name_missing(tenant: Dict) -> bool:
+        """Whether a unit not marked vacant has no tenant name."""
+        return not tenant.get("tenant") and tenant.get("occupied") is not False
+
+    @classmethod
+    def _tenant_needs_review(cls, tenant: Dict) -> bool:
+        """Whether _validate_tenant_record would report any issue for a tenant."""
+        return (
+            cls._tenant_name_missing(tenant)
+            or tenant.get("square_footage", 0) <= 0
+            or tenant.get("current_rent", 0) < 0
+        )
 
     def _validate_tenant_record(
         self, result: ValidationResult, tenant: Dict, index: int
@@ -305,10 +453,10 @@ class DocumentValidator:
         """Validate a single tenant record."""
         unit = tenant.get("unit", f"index_{index}")
 
-        if not tenant.get("tenant") and not tenant.get("occupied") == False:
+        if self._tenant_name_missing(tenant):
             result.add_issue(
                 ValidationIssue(
-                    severity="warning",
+                    severity=Severity.WARNING,
                     field=f"tenant_{index}_name",
                     message=f"Missing tenant name for unit {unit}",
                     current_value=None,
@@ -319,7 +467,7 @@ class DocumentValidator:
         if square_footage <= 0:
             result.add_issue(
                 ValidationIssue(
-                    severity="critical",
+                    severity=Severity.CRITICAL,
                     field=f"tenant_{index}_square_footage",
                     message=f"Invalid square footage for unit {unit}",
                     current_value=square_footage,
@@ -331,7 +479,7 @@ class DocumentValidator:
         if rent < 0:
             result.add_issue(
                 ValidationIssue(
-                    severity="critical",
+                    severity=Severity.CRITICAL,
                     field=f"tenant_{index}_rent",
                     message=f"Negative rent for unit {unit}",
                     current_value=rent,
@@ -340,43 +488,52 @@ class DocumentValidator:
             )
 
     def _calculate_confidence(
-        self, issues: List[ValidationIssue], data_points: int
+        self, result: ValidationResult, data_points: int
     ) -> float:
         """Calculate confidence score based on issues and data points."""
         if data_points == 0:
             return 0.0
 
-        critical_penalty = 0.1 * len(
-            [i for i in issues if i.severity == "critical"]
-        )
-        warning_penalty = 0.05 * len(
-            [i for i in issues if i.severity == "warning"]
-        )
-        info_penalty = 0.01 * len([i for i in issues if i.severity == "info"])
+        critical = result.severity_count(Severity.CRITICAL)
+        warning = result.severity_count(Severity.WARNING)
+        info = result.severity_count(Severity.INFO)
 
-        confidence = 1.0 - critical_penalty - warning_penalty - info_penalty
+        confidence = 1.0 - 0.1 * critical - 0.05 * warning - 0.01 * info
         return round(max(0.0, min(1.0, confidence)), 2)
 
     def get_validation_report(
-        self, rent_roll_data: Dict, pl_data: Dict, financial_metrics: Dict
+        self,
+        rent_roll_data: Dict,
+        pl_data: Dict,
+        financial_metrics: Dict,
+        verbose: bool = True,
     ) -> Dict:
-        """Generate comprehensive validation report."""
-        rent_roll_result = self.validate_rent_roll(rent_roll_data)
-        pl_result = self.validate_pl_statement(pl_data)
-        metrics_result = self.validate_financial_metrics(financial_metrics)
-        cross_result = self.validate_cross_field_consistency(
-            rent_roll_data, pl_data, financial_metrics
+        """
+        Generate comprehensive validation report.
+
+        With verbose=False each validation stops at its first critical issue,
+        which is enough for a pass/fail gate but may list fewer issues.
+        """
+        fast_fail = not verbose
+        now = datetime.now()
+        rent_roll_result = self.validate_rent_roll(
+            rent_roll_data, fast_fail=fast_fail, validated_at=now
         )
-
-        all_issues = (
-            rent_roll_result.issues
-            + pl_result.issues
-            + metrics_result.issues
-            + cross_result.issues
+        pl_result = self.validate_pl_statement(pl_data, fast_fail=fast_fail, validated_at=now)
+        metrics_result = self.validate_financial_metrics(
+            financial_metrics, fast_fail=fast_fail, validated_at=now
+        )
+        cross_result = self.validate_cross_field_consistency(
+            rent_roll_data, pl_data, financial_metrics, validated_at=now
         )
 
-        overall_valid = all(
-            r.is_valid for r in [rent_roll_result, pl_result, metrics_result]
+        # Cross-field checks only raise warnings today, but a critical one
+        # should invalidate the report like any other.
+        overall_valid = (
+            rent_roll_result.is_valid
+            and pl_result.is_valid
+            and metrics_result.is_valid
+            and cross_result.is_valid
         )
 
         avg_confidence = (
@@ -385,13 +542,15 @@ class DocumentValidator:
             + metrics_result.confidence_score
         ) / 3
 
+        # The sub-results are discarded after this, so their summaries can
+        # share the live severity lists instead of copying them.
         return {
             "overall_valid": overall_valid,
             "confidence_score": round(avg_confidence, 2),
-            "rent_roll_validation": rent_roll_result.get_summary(),
-            "pl_validation": pl_result.get_summary(),
-            "metrics_validation": metrics_result.get_summary(),
-            "cross_validation": cross_result.get_summary(),
+            "rent_roll_validation": rent_roll_result._summary(),
+            "pl_validation": pl_result._summary(),
+            "metrics_validation": metrics_result._summary(),
+            "cross_validation": cross_result._summary(),
             "all_issues": [
                 {
                     "severity": i.severity,
@@ -400,18 +559,19 @@ class DocumentValidator:
                     "current_value": i.current_value,
                     "suggested_value": i.suggested_value,
                 }
-                for i in all_issues
+                for result in (rent_roll_result, pl_result, metrics_result, cross_result)
+                for i in result.issues
             ],
             "risk_flags": self._generate_risk_flags(metrics_result),
-            "validated_at": datetime.now().isoformat(),
+            "validated_at": now.isoformat(),
         }
 
     def _generate_risk_flags(self, metrics_result: ValidationResult) -> List[str]:
         """Generate risk flags from validation results."""
         flags = []
         for issue in metrics_result.issues:
-            if issue.severity == "critical":
+            if issue.severity == Severity.CRITICAL:
                 flags.append(f"CRITICAL: {issue.field} - {issue.message}")
-            elif issue.severity == "warning":
+            elif issue.severity == Severity.WARNING:
                 flags.append(f"WARNING: {issue.field} - {issue.message}")
         return flags
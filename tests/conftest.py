@@ -1,7 +1,8 @@
-import asyncio
 import pytest
 import pytest_asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
+from io import BytesIO
+from pathlib import Path
 from typing import AsyncGenerator, Generator
 from fastapi.testclient import TestClient
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
@@ -10,23 +11,24 @@ from backend.main import app
 from backend.db.mongodb import MongoDB
 
 
-@pytest.fixture(scope="session")
-def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
-
-
 @pytest.fixture
 def test_client() -> Generator[TestClient, None, None]:
     with TestClient(app) as client:
         yield client
 
 
+@pytest.fixture(scope="session")
+def motor_mocks() -> tuple[MagicMock, MagicMock]:
+    # spec= walks the motor classes' whole API, so build the mocks once and
+    # reset them per test instead.
+    return MagicMock(spec=AsyncIOMotorDatabase), MagicMock(spec=AsyncIOMotorClient)
+
+
 @pytest_asyncio.fixture
-async def mock_mongodb() -> AsyncGenerator[MagicMock, None]:
-    mock_db = MagicMock(spec=AsyncIOMotorDatabase)
-    mock_client = MagicMock(spec=AsyncIOMotorClient)
+async def mock_mongodb(motor_mocks) -> AsyncGenerator[MagicMock, None]:
+    mock_db, mock_client = motor_mocks
+    mock_db.reset_mock(return_value=True, side_effect=True)
+    mock_client.reset_mock(return_value=True, side_effect=True)
     mock_client.__getitem__ = MagicMock(return_value=mock_db)
     mock_db.__getitem__ = MagicMock(return_value=MagicMock())
 
@@ -35,7 +37,34 @@ async def mock_mongodb() -> AsyncGenerator[MagicMock, None]:
             yield mock_db
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def fast_tmpdir(tmp_path_factory) -> Path:
+    return tmp_path_factory.mktemp("docs")
+
+
+@pytest.fixture(scope="session")
+def sample_xlsx_bytes() -> bytes:
+    import pandas as pd
+
+    buffer = BytesIO()
+    with pd.ExcelWriter(buffer, engine="openpyxl") as writer:
+        pd.DataFrame({"A": [1, 2, 3], "B": [4, 5, 6]}).to_excel(writer, sheet_name="TestSheet")
+    return buffer.getvalue()
+
+
+@pytest.fixture(scope="session")
+def sample_docx_bytes() -> bytes:
+    from docx import Document
+
+    doc = Document()
+    doc.add_paragraph("Hello World")
+    doc.add_paragraph("Test content")
+    buffer = BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+
+@pytest.fixture(scope="session")
 def sample_pdf_content() -> str:
     return """
     RENT ROLL
@@ -50,7 +79,7 @@ def sample_pdf_content() -> str:
     """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_pl_content() -> str:
     return """
     INCOME STATEMENT
@@ -74,7 +103,7 @@ def sample_pl_content() -> str:
     """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_lease_content() -> str:
     return """
     COMMERCIAL LEASE AGREEMENT
@@ -99,7 +128,7 @@ def sample_lease_content() -> str:
     """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_operating_statement_content() -> str:
     return """
     OPERATING STATEMENT
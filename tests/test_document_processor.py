@@ -1,18 +1,31 @@
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
-import os
-import tempfile
+from uuid import uuid4
 
 from backend.services.ocr import DocumentProcessor
 
 
+def _write_file(directory, suffix: str, content: bytes) -> str:
+    """Write content to a uniquely named file in the shared test directory."""
+    path = directory / f"{uuid4().hex}{suffix}"
+    path.write_bytes(content)
+    return str(path)
+
+
+@pytest.fixture(scope="module")
+def shared_processor():
+    """Create one DocumentProcessor for the whole module."""
+    return DocumentProcessor()
+
+
 class TestDocumentProcessor:
     """Tests for DocumentProcessor class."""
 
     @pytest.fixture
-    def processor(self):
-        """Create a DocumentProcessor instance."""
-        return DocumentProcessor()
+    def processor(self, shared_processor):
+        """Hand each test the shared processor with an empty text cache."""
+        shared_processor._text_cache.clear()
+        return shared_processor
 
     def test_init(self, processor):
         """Test processor initialization."""
@@ -24,62 +37,41 @@ class TestDocumentProcessor:
         assert "LeaseExtractor" in extractor_names
 
     @pytest.mark.asyncio
-    async def test_process_document_pdf(self, processor, sample_pdf_content):
+    async def test_process_document_pdf(self, processor, fast_tmpdir, sample_pdf_content):
         """Test processing a PDF document."""
-        with tempfile.NamedTemporaryFile(
-            suffix=".pdf", delete=False
-        ) as tmp_file:
-            tmp_file.write(b"fake pdf content")
-            tmp_file_path = tmp_file.name
-
-        try:
-            with patch.object(
-                processor, "_process_pdf", new=AsyncMock(return_value=sample_pdf_content)
-            ):
-                result = await processor.process_document(tmp_file_path)
-
-            assert "status" in result
-            assert result["status"] in ["success", "error"]
-        finally:
-            os.unlink(tmp_file_path)
+        tmp_file_path = _write_file(fast_tmpdir, ".pdf", b"fake pdf content")
+
+        with patch.object(
+            processor, "_process_pdf", new=AsyncMock(return_value=sample_pdf_content)
+        ):
+            result = await processor.process_document(tmp_file_path)
+
+        assert "status" in result
+        assert result["status"] in ["success", "error"]
 
     @pytest.mark.asyncio
-    async def test_process_document_excel(self, processor):
+    async def test_process_document_excel(self, processor, fast_tmpdir):
         """Test processing an Excel document."""
-        with tempfile.NamedTemporaryFile(
-            suffix=".xlsx", delete=False
-        ) as tmp_file:
-            tmp_file.write(b"fake excel content")
-            tmp_file_path = tmp_file.name
-
-        try:
-            with patch.object(
-                processor, "_process_excel", new=AsyncMock(return_value="Sheet: Test\nData")
-            ):
-                result = await processor.process_document(tmp_file_path)
-
-            assert "status" in result
-        finally:
-            os.unlink(tmp_file_path)
+        tmp_file_path = _write_file(fast_tmpdir, ".xlsx", b"fake excel content")
+
+        with patch.object(
+            processor, "_process_excel", new=AsyncMock(return_value="Sheet: Test\nData")
+        ):
+            result = await processor.process_document(tmp_file_path)
+
+        assert "status" in result
 
     @pytest.mark.asyncio
-    async def test_process_document_word(self, processor):
+    async def test_process_document_word(self, processor, fast_tmpdir):
         """Test processing a Word document."""
-        with tempfile.NamedTemporaryFile(
-            suffix=".docx", delete=False
-        ) as tmp_file:
-            tmp_file.write(b"fake word content")
-            tmp_file_path = tmp_file.name
-
-        try:
-            with patch.object(
-                processor, "_process_word", new=AsyncMock(return_value="Document content")
-            ):
-                result = await processor.process_document(tmp_file_path)
-
-            assert "status" in result
-        finally:
-            os.unlink(tmp_file_path)
+        tmp_file_path = _write_file(fast_tmpdir, ".docx", b"fake word content")
+
+        with patch.object(
+            processor, "_process_word", new=AsyncMock(return_value="Document content")
+        ):
+            result = await processor.process_document(tmp_file_path)
+
+        assert "status" in result
 
     @pytest.mark.asyncio
     async def test_process_document_file_not_found(self, processor):
@@ -90,209 +82,177 @@ class TestDocumentProcessor:
         assert "File not found" in result["error"]
 
     @pytest.mark.asyncio
-    async def test_process_document_unsupported_type(self, processor):
+    async def test_process_document_unsupported_type(self, processor, fast_tmpdir):
         """Test processing unsupported file type."""
-        with tempfile.NamedTemporaryFile(
-            suffix=".txt", delete=False
-        ) as tmp_file:
-            tmp_file.write(b"text content")
-            tmp_file_path = tmp_file.name
+        tmp_file_path = _write_file(fast_tmpdir, ".txt", b"text content")
 
-        try:
-            result = await processor.process_document(tmp_file_path)
+        result = await processor.process_document(tmp_file_path)
 
-            assert result["status"] == "error"
-            assert "Unsupported file type" in result["error"]
-        finally:
-            os.unlink(tmp_file_path)
+        assert result["status"] == "error"
+        assert "Unsupported file type" in result["error"]
 
     @pytest.mark.asyncio
     async def test_process_document_extraction_success(
-        self, processor, sample_pdf_content
+        self, processor, fast_tmpdir, sample_pdf_content
     ):
         """Test successful extraction from document."""
-        with tempfile.NamedTemporaryFile(
-            suffix=".pdf", delete=False
-        ) as tmp_file:
-            tmp_file.write(b"fake pdf content")
-            tmp_file_path = tmp_file.name
-
-        try:
-            with patch.object(
-                processor, "_process_pdf", new=AsyncMock(return_value=sample_pdf_content)
-            ):
-                result = await processor.process_document(tmp_file_path)
-
-            if result["status"] == "success":
-                assert "extractions" in result
-                assert len(result["extractions"]) >= 0
-                assert "processed_at" in result
-        finally:
-            os.unlink(tmp_file_path)
+        tmp_file_path = _write_file(fast_tmpdir, ".pdf", b"fake pdf content")
+
+        with patch.object(
+            processor, "_process_pdf", new=AsyncMock(return_value=sample_pdf_content)
+        ):
+            result = await processor.process_document(tmp_file_path)
+
+        if result["status"] == "success":
+            assert "extractions" in result
+            assert len(result["extractions"]) >= 0
+            assert "processed_at" in result
 
     @pytest.mark.asyncio
-    async def test_process_document_no_extractions(self, processor):
+    async def test_process_document_no_extractions(self, processor, fast_tmpdir):
         """Test processing document with no matching extractors."""
         content = "This document has no matching extractors content at all."
-        with tempfile.NamedTemporaryFile(
-            suffix=".pdf", delete=False
-        ) as tmp_file:
-            tmp_file.write(b"fake pdf content")
-            tmp_file_path = tmp_file.name
-
-        try:
-            with patch.object(
-                processor, "_process_pdf", new=AsyncMock(return_value=content)
-            ):
-                result = await processor.process_document(tmp_file_path)
-
-            if result["status"] == "success":
-                assert "extractions" in result
-        finally:
-            os.unlink(tmp_file_path)
+        tmp_file_path = _write_file(fast_tmpdir, ".pdf", b"fake pdf content")
+
+        with patch.object(
+            processor, "_process_pdf", new=AsyncMock(return_value=content)
+        ):
+            result = await processor.process_document(tmp_file_path)
+
+        if result["status"] == "success":
+            assert "extractions" in result
 
     @pytest.mark.asyncio
-    async def test_process_document_exception_handling(self, processor):
+    async def test_process_document_exception_handling(self, processor, fast_tmpdir):
         """Test exception handling during processing."""
-        with tempfile.NamedTemporaryFile(
-            suffix=".pdf", delete=False
-        ) as tmp_file:
-            tmp_file.write(b"fake pdf content")
-            tmp_file_path = tmp_file.name
-
-        try:
-            with patch.object(
-                processor, "_process_pdf", side_effect=Exception("Processing error")
-            ):
-                result = await processor.process_document(tmp_file_path)
-
-            assert result["status"] == "error"
-            assert "Processing error" in result["error"]
-            assert "processed_at" in result
-        finally:
-            os.unlink(tmp_file_path)
+        tmp_file_path = _write_file(fast_tmpdir, ".pdf", b"fake pdf content")
+
+        with patch.object(
+            processor, "_process_pdf", side_effect=Exception("Processing error")
+        ):
+            result = await processor.process_document(tmp_file_path)
+
+        assert result["status"] == "error"
+        assert "Processing error" in result["error"]
+        assert "processed_at" in result
 
     @pytest.mark.asyncio
-    async def test_process_pdf_uses_correct_path(self, processor):
+    async def test_process_document_cache_hit(self, processor, fast_tmpdir):
+        """Test re-processing an identical file reuses its extracted text."""
+        tmp_file_path = _write_file(fast_tmpdir, ".pdf", b"fake pdf content")
+
+        mock_pdf = AsyncMock(return_value="Plain document text")
+        with patch.object(processor, "_process_pdf", new=mock_pdf):
+            first = await processor.process_document(tmp_file_path)
+            second = await processor.process_document(tmp_file_path)
+
+        mock_pdf.assert_awaited_once()
+        assert second["text"] == first["text"]
+
+    @pytest.mark.asyncio
+    async def test_process_pdf_uses_correct_path(self, processor, fast_tmpdir):
         """Test PDF processing uses correct poppler path."""
         from backend.config.settings import settings
 
-        with tempfile.NamedTemporaryFile(
-            suffix=".pdf", delete=False
-        ) as tmp_file:
-            tmp_file.write(b"fake pdf content")
-            tmp_file_path = tmp_file.name
+        tmp_file_path = _write_file(fast_tmpdir, ".pdf", b"fake pdf content")
 
-        try:
-            with patch("pdf2image.convert_from_path") as mock_convert:
-                mock_convert.return_value = []
-                with patch("pytesseract.image_to_string", return_value="text"):
-                    await processor._process_pdf(tmp_file_path)
+        with patch("pdf2image.convert_from_path") as mock_convert:
+            mock_convert.return_value = []
+            with patch("pytesseract.image_to_string", return_value="text"):
+                await processor._process_pdf(tmp_file_path)
 
-                mock_convert.assert_called_once()
-        finally:
-            os.unlink(tmp_file_path)
+            mock_convert.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_process_pdf_exception(self, processor):
+    async def test_process_pdf_exception(self, processor, fast_tmpdir):
         """Test PDF processing exception handling."""
-        with tempfile.NamedTemporaryFile(
-            suffix=".pdf", delete=False
-        ) as tmp_file:
-            tmp_file.write(b"fake pdf content")
-            tmp_file_path = tmp_file.name
+        tmp_file_path = _write_file(fast_tmpdir, ".pdf", b"fake pdf content")
 
-        try:
-            with patch("pdf2image.convert_from_path", side_effect=Exception("PDF error")):
-                result = await processor._process_pdf(tmp_file_path)
+        with patch("pdf2image.convert_from_path", side_effect=Exception("PDF error")):
+            result = await processor._process_pdf(tmp_file_path)
 
-            assert result is None
-        finally:
-            os.unlink(tmp_file_path)
+        assert result is None
 
-    @pytest.mark.asyncio
-    async def test_process_excel(self, processor):
-        """Test Excel file processing."""
-        import pandas as pd
-        from io import BytesIO
+    def test_ocr_page_limits_tesseract_threads(self):
+        """Test the tesseract subprocess, not this process, gets OMP_THREAD_LIMIT."""
+        from backend.services import ocr
 
-        df = pd.DataFrame({"A": [1, 2, 3], "B": [4, 5, 6]})
-        excel_buffer = BytesIO()
-        with pd.ExcelWriter(excel_buffer, engine="openpyxl") as writer:
-            df.to_excel(writer, sheet_name="TestSheet")
-        excel_content = excel_buffer.getvalue()
+        mock_run = MagicMock(return_value=MagicMock(stdout=b"page text"))
+        with patch.object(ocr, "tesserocr", None), \
+                patch.dict("os.environ", clear=False) as environ, \
+                patch("backend.services.ocr.subprocess.run", mock_run):
+            environ.pop("OMP_THREAD_LIMIT", None)
+            assert ocr._ocr_page("page.ppm") == "page text"
+            assert "OMP_THREAD_LIMIT" not in environ
 
-        with tempfile.NamedTemporaryFile(
-            suffix=".xlsx", delete=False
-        ) as tmp_file:
-            tmp_file.write(excel_content)
-            tmp_file_path = tmp_file.name
+        assert mock_run.call_args.kwargs["env"]["OMP_THREAD_LIMIT"] == "1"
 
-        try:
-            result = await processor._process_excel(tmp_file_path)
+    def test_extract_embedded_text_without_pdftotext(self):
+        """Test the embedded text fast path yields nothing when poppler is missing."""
+        from backend.services.ocr import _extract_embedded_text
 
-            assert result is not None
-            assert "TestSheet" in result
-        finally:
-            os.unlink(tmp_file_path)
+        assert _extract_embedded_text("missing.pdf", poppler_path="/nonexistent") == []
 
     @pytest.mark.asyncio
-    async def test_process_excel_exception(self, processor):
-        """Test Excel processing exception handling."""
-        with tempfile.NamedTemporaryFile(
-            suffix=".xlsx", delete=False
-        ) as tmp_file:
-            tmp_file.write(b"invalid excel content")
-            tmp_file_path = tmp_file.name
+    async def test_process_pdf_ocrs_only_pages_without_text(self, processor, fast_tmpdir):
+        """Test a mixed PDF keeps its digital pages and OCRs only the scanned ones."""
+        from backend.services import ocr
+
+        tmp_file_path = _write_file(fast_tmpdir, ".pdf", b"fake pdf content")
+        digital = "Unit 101 ABC Corporation 1,500 SF $3,500.00 monthly rent" * 2
+        mock_convert = MagicMock(return_value=[])
+
+        with patch("backend.services.ocr.pdfinfo_from_path", return_value={"Pages": 4}), \
+                patch(
+                    "backend.services.ocr._extract_embedded_text",
+                    return_value=[digital, "", digital, "  "],
+                ), \
+                patch("backend.services.ocr.convert_from_path", mock_convert):
+            result = await processor._process_pdf(tmp_file_path)
+
+        pages = [
+            (call.kwargs["first_page"], call.kwargs["last_page"])
+            for call in mock_convert.call_args_list
+            if call.kwargs["dpi"] == ocr.settings.OCR_DPI
+        ]
+        assert pages == [(2, 2), (4, 4)]
+        assert result.count(digital) == 2
 
-        try:
-            result = await processor._process_excel(tmp_file_path)
+    @pytest.mark.asyncio
+    async def test_process_excel(self, processor, fast_tmpdir, sample_xlsx_bytes):
+        """Test Excel file processing."""
+        tmp_file_path = _write_file(fast_tmpdir, ".xlsx", sample_xlsx_bytes)
 
-            assert result is None
-        finally:
-            os.unlink(tmp_file_path)
+        result = await processor._process_excel(tmp_file_path)
+
+        assert result is not None
+        assert "TestSheet" in result
 
     @pytest.mark.asyncio
-    async def test_process_word(self, processor):
-        """Test Word document processing."""
-        from docx import Document
-        from io import BytesIO
+    async def test_process_excel_exception(self, processor, fast_tmpdir):
+        """Test Excel processing exception handling."""
+        tmp_file_path = _write_file(fast_tmpdir, ".xlsx", b"invalid excel content")
 
-        doc = Document()
-        doc.add_paragraph("Hello World")
-        doc.add_paragraph("Test content")
+        result = await processor._process_excel(tmp_file_path)
 
-        buffer = BytesIO()
-        doc.save(buffer)
-        word_content = buffer.getvalue()
+        assert result is None
 
-        with tempfile.NamedTemporaryFile(
-            suffix=".docx", delete=False
-        ) as tmp_file:
-            tmp_file.write(word_content)
-            tmp_file_path = tmp_file.name
+    @pytest.mark.asyncio
+    async def test_process_word(self, processor, fast_tmpdir, sample_docx_bytes):
+        """Test Word document processing."""
+        tmp_file_path = _write_file(fast_tmpdir, ".docx", sample_docx_bytes)
 
-        try:
-            result = await processor._process_word(tmp_file_path)
+        result = await processor._process_word(tmp_file_path)
 
-            assert result is not None
-            assert "Hello World" in result
-            assert "Test content" in result
-        finally:
-            os.unlink(tmp_file_path)
+        assert result is not None
+        assert "Hello World" in result
+        assert "Test content" in result
 
     @pytest.mark.asyncio
-    async def test_process_word_exception(self, processor):
+    async def test_process_word_exception(self, processor, fast_tmpdir):
         """Test Word processing exception handling."""
-        with tempfile.NamedTemporaryFile(
-            suffix=".docx", delete=False
-        ) as tmp_file:
-            tmp_file.write(b"invalid docx content")
-            tmp_file_path = tmp_file.name
-
-        try:
-            result = await processor._process_word(tmp_file_path)
-
-            assert result is None
-        finally:
-            os.unlink(tmp_file_path)
+        tmp_file_path = _write_file(fast_tmpdir, ".docx", b"invalid docx content")
+
+        result = await processor._process_word(tmp_file_path)
+
+        assert result is None
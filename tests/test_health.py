@@ -1,35 +1,41 @@
 """Test suite for API health endpoints."""
 
+import httpx
 import pytest
-from fastapi.testclient import TestClient
+import pytest_asyncio
 from backend.main import app
 
 
-@pytest.fixture
-def client():
-    """Create test client."""
-    return TestClient(app)
+@pytest_asyncio.fixture(scope="module")
+async def client():
+    """Create one in-process ASGI client shared by the module."""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
 
 
-def test_health_live(client):
+@pytest.mark.asyncio
+async def test_health_live(client):
     """Test liveness probe endpoint."""
-    response = client.get("/api/v1/health/live")
+    response = await client.get("/api/v1/health/live")
     assert response.status_code == 200
     data = response.json()
     assert data["status"] == "alive"
 
 
-def test_health_ready_no_mongo(client):
+@pytest.mark.asyncio
+async def test_health_ready_no_mongo(client):
     """Test readiness probe without MongoDB connection."""
-    response = client.get("/api/v1/health/ready")
+    response = await client.get("/api/v1/health/ready")
     assert response.status_code == 200
     data = response.json()
     assert "status" in data
 
 
-def test_health_endpoint_structure(client):
+@pytest.mark.asyncio
+async def test_health_endpoint_structure(client):
     """Test health endpoint returns proper structure."""
-    response = client.get("/api/v1/health")
+    response = await client.get("/api/v1/health")
     assert response.status_code == 200
 
     data = response.json()
@@ -0,0 +1,79 @@
+import io
+import json
+import logging
+import threading
+import time
+
+from backend.services.logging import (
+    BufferedStreamHandler,
+    CustomJsonFormatter,
+    StructuredLogger,
+)
+
+
+class _CapturingHandler(logging.Handler):
+    """Handler that keeps formatted records and signals when one arrives."""
+
+    def __init__(self):
+        super().__init__()
+        self.lines = []
+        self.received = threading.Event()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.lines.append(self.format(record))
+        self.received.set()
+
+
+class _FlushCountingStream(io.StringIO):
+    """StringIO that records how often it was flushed."""
+
+    def __init__(self):
+        super().__init__()
+        self.flushes = 0
+
+    def flush(self) -> None:
+        self.flushes += 1
+        super().flush()
+
+
+class TestBufferedStreamHandler:
+    """Tests for BufferedStreamHandler."""
+
+    def test_info_records_flushed_by_one_shared_thread(self):
+        """Test deferred flushes across several windows reuse a single flusher thread."""
+        stream = _FlushCountingStream()
+        handler = BufferedStreamHandler(stream)
+        record = logging.makeLogRecord({"msg": "tick", "levelno": logging.INFO})
+
+        for _ in range(3):
+            flushes = stream.flushes
+            handler.handle(record)
+            deadline = time.monotonic() + 5
+            while stream.flushes == flushes and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert stream.flushes > flushes
+
+        flushers = [t for t in threading.enumerate() if t.name == "log-flusher"]
+        assert len(flushers) == 1
+        assert stream.getvalue() == "tick\n" * 3
+
+
+class TestStructuredLogger:
+    """Tests for StructuredLogger."""
+
+    def test_exception_field_survives_queue(self):
+        """Test that logger.exception emits a separate exception field."""
+        logger = StructuredLogger("test-logging-exception")
+        handler = _CapturingHandler()
+        handler.setFormatter(CustomJsonFormatter("%(timestamp)s %(level)s %(message)s"))
+        logger.add_handler(handler)
+
+        try:
+            raise ZeroDivisionError("division by zero")
+        except ZeroDivisionError:
+            logger.logger.exception("boom %s", "here")
+
+        assert handler.received.wait(timeout=5)
+        record = json.loads(handler.lines[0])
+        assert record["message"] == "boom here"
+        assert "ZeroDivisionError" in record["exception"]
@@ -1,11 +1,25 @@
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime, timedelta
+from types import SimpleNamespace
 from bson import ObjectId
 
 from backend.db.mongodb import MongoDB
 
 
+# Well-formed id for lookups that are expected to find nothing
+_MISSING_OID = "507f1f77bcf86cd799439011"
+
+
+def _make_cursor(items: list) -> MagicMock:
+    """Mock a motor cursor whose sort/limit chain and to_list yield items."""
+    cursor = MagicMock()
+    cursor.to_list = AsyncMock(return_value=items)
+    cursor.sort = MagicMock(return_value=cursor)
+    cursor.limit = MagicMock(return_value=cursor)
+    return cursor
+
+
 class TestMongoDB:
     """Tests for MongoDB class."""
 
@@ -22,17 +36,21 @@ class TestMongoDB:
     async def test_connect_db_success(self, mock_client):
         """Test successful database connection."""
         mock_client_instance, mock_db = mock_client
+        mock_db.documents.create_index = AsyncMock()
 
         with patch.object(MongoDB, 'client', None):
             with patch.object(MongoDB, 'db', None):
-                with patch('motor.motor_asyncio.AsyncIOMotorClient', return_value=mock_client_instance):
+                with patch('backend.db.mongodb.AsyncIOMotorClient', return_value=mock_client_instance):
                     result = await MongoDB.connect_db(
                         mongodb_url="mongodb://localhost:27017",
                         db_name="test_db"
                     )
 
-        assert MongoDB.client is not None
-        assert MongoDB.db is not None
+                    assert MongoDB.client is mock_client_instance
+                    assert MongoDB.db is mock_db
+
+        assert result is mock_db
+        assert mock_db.documents.create_index.await_count == 4
 
     @pytest.mark.asyncio
     async def test_close_db(self, mock_client):
@@ -87,7 +105,7 @@ class TestMongoDB:
         MongoDB.client = mock_client_instance
         MongoDB.db = mock_db
 
-        result = await MongoDB.get_document_by_id(str(ObjectId()))
+        result = await MongoDB.get_document_by_id(_MISSING_OID)
 
         assert result is None
 
@@ -101,9 +119,7 @@ class TestMongoDB:
             {"_id": ObjectId(), "filename": "doc2.pdf"},
         ]
 
-        mock_cursor = MagicMock()
-        mock_cursor.to_list = AsyncMock(return_value=test_docs)
-        mock_db.documents.find = MagicMock(return_value=mock_cursor)
+        mock_db.documents.find = MagicMock(return_value=_make_cursor(test_docs))
 
         MongoDB.client = mock_client_instance
         MongoDB.db = mock_db
@@ -123,11 +139,7 @@ class TestMongoDB:
             {"_id": ObjectId(), "filename": "doc2.pdf"},
         ]
 
-        mock_cursor = MagicMock()
-        mock_cursor.to_list = AsyncMock(return_value=test_docs)
-        mock_cursor.sort = MagicMock(return_value=mock_cursor)
-        mock_cursor.limit = MagicMock(return_value=mock_cursor)
-        mock_db.documents.find = MagicMock(return_value=mock_cursor)
+        mock_db.documents.find = MagicMock(return_value=_make_cursor(test_docs))
 
         MongoDB.client = mock_client_instance
         MongoDB.db = mock_db
@@ -146,9 +158,7 @@ class TestMongoDB:
             {"_id": "PLStatementExtractor", "count": 5, "avg_confidence": 0.85},
         ]
 
-        mock_cursor = MagicMock()
-        mock_cursor.to_list = AsyncMock(return_value=test_stats)
-        mock_db.documents.aggregate = MagicMock(return_value=mock_cursor)
+        mock_db.documents.aggregate = MagicMock(return_value=_make_cursor(test_stats))
 
         MongoDB.client = mock_client_instance
         MongoDB.db = mock_db
@@ -163,7 +173,7 @@ class TestMongoDB:
         """Test cleanup of failed documents."""
         mock_client_instance, mock_db = mock_client
 
-        mock_db.documents.delete_many = AsyncMock(return_value=MagicMock(deleted_count=5))
+        mock_db.documents.delete_many = AsyncMock(return_value=SimpleNamespace(deleted_count=5))
 
         MongoDB.client = mock_client_instance
         MongoDB.db = mock_db
@@ -180,7 +190,7 @@ class TestMongoDB:
 
         with patch.object(MongoDB, 'client', None):
             with patch.object(MongoDB, 'db', None):
-                with patch('motor.motor_asyncio.AsyncIOMotorClient', side_effect=Exception("Connection failed")):
+                with patch('backend.db.mongodb.AsyncIOMotorClient', side_effect=Exception("Connection failed")):
                     with pytest.raises(Exception):
                         await MongoDB.connect_db()
 
@@ -201,5 +211,4 @@ class TestMongoDB:
             await MongoDB._create_indexes()
 
             calls = mock_db.documents.create_index.call_args_list
-            ttl_call = [c for c in calls if "expireAfterSeconds" in str(c)]
-            assert len(ttl_call) > 0
+            assert any("expireAfterSeconds" in str(c) for c in calls)
@@ -0,0 +1,129 @@
+import threading
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from backend.services import processing_status
+from backend.services.processing_status import (
+    DocumentProcessingStatus,
+    ProcessingStatus,
+    ProcessingStatusTracker,
+)
+
+
+class _Clock:
+    """Stand-in for time.monotonic_ns that only moves when told to."""
+
+    def __init__(self):
+        self.now_ns = 1_000_000_000
+
+    def __call__(self) -> int:
+        return self.now_ns
+
+
+class TestProcessingStatusTracker:
+    """Tests for ProcessingStatusTracker."""
+
+    def test_create_status_returns_model(self):
+        """Test create_status hands back a pydantic snapshot, not internal state."""
+        tracker = ProcessingStatusTracker()
+
+        status = tracker.create_status("doc-1", "rent_roll.pdf")
+
+        assert isinstance(status, DocumentProcessingStatus)
+        assert status.status == ProcessingStatus.PENDING
+        assert tracker.get_status("doc-1") == status
+
+    def test_status_expires_after_ttl(self):
+        """Test a status can no longer be read or updated once its TTL has passed."""
+        tracker = ProcessingStatusTracker()
+        clock = _Clock()
+
+        with patch.object(processing_status, "time", SimpleNamespace(monotonic_ns=clock)):
+            tracker.create_status("doc-1", "rent_roll.pdf")
+            clock.now_ns += processing_status._STATUS_TTL_NS
+            assert tracker.get_status("doc-1") is not None
+
+            clock.now_ns += 1
+            assert tracker.get_status("doc-1") is None
+            assert tracker.update_status("doc-1", ProcessingStatus.EXTRACTING) is None
+            assert tracker.get_all_statuses() == []
+
+    def test_backdated_status_is_live_when_created(self):
+        """Test a created_at older than the TTL does not expire the new status."""
+        tracker = ProcessingStatusTracker()
+        created_at = datetime.now(timezone.utc) - timedelta(days=3)
+
+        tracker.create_status("doc-1", "rent_roll.pdf", created_at=created_at)
+        updated = tracker.update_status("doc-1", ProcessingStatus.EXTRACTING)
+
+        assert updated is not None
+        assert updated.created_at == created_at
+        assert tracker.get_status("doc-1").status == ProcessingStatus.EXTRACTING
+
+    def test_oldest_statuses_evicted_beyond_size_bound(self):
+        """Test inserting past _STATUS_CACHE_SIZE drops the oldest statuses first."""
+        tracker = ProcessingStatusTracker()
+
+        with patch.object(processing_status, "_STATUS_CACHE_SIZE", 3):
+            for i in range(5):
+                tracker.create_status(f"doc-{i}", f"file_{i}.pdf")
+
+        ids = [status.id for status in tracker.get_all_statuses()]
+        assert ids == ["doc-2", "doc-3", "doc-4"]
+
+    def test_recreating_status_resets_it_and_renews_its_place(self):
+        """Test re-creating an id replaces its state and moves it to the newest slot."""
+        tracker = ProcessingStatusTracker()
+
+        with patch.object(processing_status, "_STATUS_CACHE_SIZE", 2):
+            tracker.create_status("doc-0", "first.pdf")
+            tracker.create_status("doc-1", "second.pdf")
+            tracker.update_status("doc-0", ProcessingStatus.ERROR, error="failed")
+            tracker.create_status("doc-0", "retry.pdf")
+            tracker.create_status("doc-2", "third.pdf")
+
+        recreated = tracker.get_status("doc-0")
+        assert recreated.filename == "retry.pdf"
+        assert recreated.status == ProcessingStatus.PENDING
+        assert recreated.error is None
+        assert tracker.get_status("doc-1") is None
+
+    def test_concurrent_updates_and_snapshots(self):
+        """Test snapshots taken while other threads mutate never fail or tear."""
+        tracker = ProcessingStatusTracker()
+        tracker.create_status("doc-1", "rent_roll.pdf")
+        errors = []
+
+        def mutate(worker: int):
+            try:
+                for i in range(50):
+                    extractor = f"Extractor{worker}_{i}"
+                    tracker.start_extractor("doc-1", extractor)
+                    tracker.add_history_step(
+                        "doc-1", extractor, ProcessingStatus.COMPLETED, {"i": i}
+                    )
+                    tracker.complete_extractor("doc-1", extractor, 0.9)
+            except Exception as e:
+                errors.append(e)
+
+        def read():
+            try:
+                for _ in range(50):
+                    status = tracker.get_status("doc-1")
+                    assert len(status.history.steps if status.history else []) <= len(
+                        status.extractor_statuses
+                    )
+                    tracker.get_all_statuses()
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=mutate, args=(n,)) for n in range(3)]
+        threads += [threading.Thread(target=read) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert len(tracker.get_status("doc-1").extractor_statuses) == 150
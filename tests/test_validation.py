@@ -0,0 +1,128 @@
+import pytest
+from backend.services.validation import DocumentValidator, Severity
+
+
+@pytest.fixture
+def rent_roll_data():
+    """Rent roll whose first two tenants each carry a critical issue."""
+    return {
+        "tenants": [
+            {"unit": "101", "tenant": "Corp", "square_footage": 0, "current_rent": 500},
+            {"unit": "102", "tenant": "LLC", "square_footage": 800, "current_rent": -5},
+            {"unit": "103", "tenant": "Inc", "square_footage": 900, "current_rent": 700},
+        ],
+        "summary": {"total_units": 3, "occupancy_rate": 85, "total_monthly_rent": 1195},
+    }
+
+
+@pytest.fixture
+def pl_data():
+    """P&L whose range check fails critically before a high expense ratio warning."""
+    return {
+        "revenue": {"items": [{"name": "Rental Income", "amount": 100}]},
+        "summary": {"gross_income": 100, "total_expenses": -1, "noi": 101, "expense_ratio": 90},
+    }
+
+
+@pytest.fixture
+def metrics():
+    """Metrics with a critical negative NOI followed by DSCR and LTV warnings."""
+    return {"noi": -5, "dscr": 1.1, "capRate": 5, "ltv": 78, "occupancyRate": 90}
+
+
+class TestDocumentValidator:
+    """Tests for DocumentValidator."""
+
+    @pytest.fixture
+    def validator(self):
+        """Create a DocumentValidator instance."""
+        return DocumentValidator()
+
+    def test_validate_rent_roll_reports_every_tenant_issue(self, validator, rent_roll_data):
+        """Test the full rent roll pass reports each tenant's critical issue."""
+        result = validator.validate_rent_roll(rent_roll_data, fast_fail=False)
+
+        assert result.is_valid is False
+        assert [i.field for i in result.issues] == [
+            "tenant_0_square_footage",
+            "tenant_1_rent",
+        ]
+
+    def test_validate_rent_roll_fast_fail(self, validator, rent_roll_data):
+        """Test fast_fail stops the rent roll pass at the first critical issue."""
+        result = validator.validate_rent_roll(rent_roll_data, fast_fail=True)
+
+        assert result.is_valid is False
+        assert [i.field for i in result.issues] == ["tenant_0_square_footage"]
+
+    def test_validate_pl_statement_reports_every_issue(self, validator, pl_data):
+        """Test the full P&L pass runs the tiered checks after a failed range check."""
+        result = validator.validate_pl_statement(pl_data, fast_fail=False)
+
+        assert result.is_valid is False
+        assert [(i.field, i.severity) for i in result.issues] == [
+            ("total_expenses", Severity.CRITICAL),
+            ("expense_ratio", Severity.WARNING),
+        ]
+
+    def test_validate_pl_statement_fast_fail(self, validator, pl_data):
+        """Test fast_fail skips the P&L tiered checks once a range check is critical."""
+        result = validator.validate_pl_statement(pl_data, fast_fail=True)
+
+        assert result.is_valid is False
+        assert [i.field for i in result.issues] == ["total_expenses"]
+        assert result.confidence_score == 0.9
+
+    def test_validate_financial_metrics_reports_every_issue(self, validator, metrics):
+        """Test the full metrics pass reports the warnings after a critical issue."""
+        result = validator.validate_financial_metrics(metrics, fast_fail=False)
+
+        assert result.is_valid is False
+        assert [(i.field, i.severity) for i in result.issues] == [
+            ("noi", Severity.CRITICAL),
+            ("dscr", Severity.WARNING),
+            ("ltv", Severity.WARNING),
+        ]
+
+    def test_validate_financial_metrics_fast_fail(self, validator, metrics):
+        """Test fast_fail stops the metrics pass at the first critical issue."""
+        result = validator.validate_financial_metrics(metrics, fast_fail=True)
+
+        assert result.is_valid is False
+        assert [i.field for i in result.issues] == ["noi"]
+
+    def test_fast_fail_matches_full_pass_for_valid_metrics(self, validator, metrics):
+        """Test fast_fail changes nothing when there is no critical issue."""
+        metrics["noi"] = 50000
+
+        full = validator.validate_financial_metrics(metrics, fast_fail=False)
+        fast = validator.validate_financial_metrics(metrics, fast_fail=True)
+
+        assert full.is_valid is fast.is_valid is True
+        assert full.issues == fast.issues
+        assert len(fast.issues) == 2
+
+    def test_validation_report_verbose(self, validator, rent_roll_data, pl_data, metrics):
+        """Test the verbose report lists every issue from every validator."""
+        report = validator.get_validation_report(rent_roll_data, pl_data, metrics)
+
+        assert report["overall_valid"] is False
+        assert len(report["all_issues"]) == 7
+        assert report["rent_roll_validation"]["total_issues"] == 2
+        assert report["pl_validation"]["total_issues"] == 2
+        assert report["metrics_validation"]["total_issues"] == 3
+
+    def test_validation_report_not_verbose(
+        self, validator, rent_roll_data, pl_data, metrics
+    ):
+        """Test verbose=False keeps the verdict but stops each validator early."""
+        report = validator.get_validation_report(
+            rent_roll_data, pl_data, metrics, verbose=False
+        )
+
+        assert report["overall_valid"] is False
+        assert len(report["all_issues"]) == 3
+        assert report["rent_roll_validation"]["total_issues"] == 1
+        assert report["pl_validation"]["total_issues"] == 1
+        assert report["metrics_validation"]["total_issues"] == 1
+        assert report["risk_flags"] == ["CRITICAL: noi - Value below minimum: -5 < 0"]